@@ -9,14 +9,78 @@ This is part of the Hybrid Approach:
 - Worldpac/SSF: Stealth Mode
 """
 
+import asyncio
 import logging
-from typing import Optional
+import re
+import time
+from typing import List, Optional, Tuple
 from decimal import Decimal
+import httpx
+from cachetools import TTLCache
+from playwright.async_api import Error as PlaywrightError, expect
 from app.adapters.labor_adapter_interface import LaborAdapterInterface, LaborTimeResult
 from app.core.config import settings
+from app.utils.async_cache import cached_call
+from app.utils.http_client import get_http_client
+from app.utils.keyword_matcher import KeywordMatcher
+from app.utils.scraper_utils import (
+    CDP_PAGE_POOL_SIZE,
+    acquire_cdp_page,
+    get_cdp_cookies,
+    release_cdp_page,
+    human_delay,
+    safe_navigate,
+    safe_click,
+    take_debug_screenshot,
+    check_session_status
+)
 
 logger = logging.getLogger(__name__)
 
+# Candidate selectors are joined into one CSS union so Playwright resolves the
+# first visible match in a single browser-side query instead of one CDP
+# round-trip per candidate.
+USERNAME_SELECTOR = "#username, input[name='username'], input[autocomplete='username'] >> visible=true"
+PASSWORD_SELECTOR = "#password, input[name='password'], input[type='password'] >> visible=true"
+DASHBOARD_SELECTOR = ".dashboard, #main-content"
+VIN_SELECTOR = "#vin-search, input[name='vin'], #vin-input, .vin-search-input >> visible=true"
+SEARCH_BUTTON_SELECTOR = "#search-btn, button.search, #vin-search-btn, [type='submit'] >> visible=true"
+LABOR_TIME_SELECTOR = ".labor-time, .time-value, [data-labor-time], .hours >> visible=true"
+
+LABOR_HOURS_PATTERN = re.compile(r'(\d+\.?\d*)')
+
+# Common job time estimates, used when the labor time can't be scraped.
+# Built once here rather than re-parsed on every estimate.
+LABOR_ESTIMATES = {
+    'brake pad': Decimal('1.2'),
+    'brake rotor': Decimal('2.0'),
+    'oil change': Decimal('0.5'),
+    'spark plug': Decimal('1.5'),
+    'battery': Decimal('0.3'),
+    'alternator': Decimal('1.5'),
+    'starter': Decimal('1.8'),
+    'water pump': Decimal('3.0'),
+    'timing belt': Decimal('4.5'),
+    'transmission fluid': Decimal('1.0'),
+    'ac compressor': Decimal('3.5'),
+    'strut': Decimal('2.5'),
+    'shock': Decimal('1.5'),
+    'tie rod': Decimal('1.2'),
+    'ball joint': Decimal('2.0'),
+    'wheel bearing': Decimal('2.5'),
+}
+DEFAULT_LABOR_ESTIMATE = Decimal('1.5')
+LABOR_ESTIMATE_MATCHER = KeywordMatcher(LABOR_ESTIMATES)
+
+# Circuit breaker: after a failed scrape, serve estimates without touching
+# the browser until the cooldown has passed.
+FAILURE_COOLDOWN_SECONDS = 60
+_last_failure: float = 0.0
+
+# Scraped labor times keyed by (vin, normalized job). A VIN's labor guide
+# doesn't change within the hour, and each miss costs a full browser scrape.
+_labor_cache: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+
 
 class AlldataScraperAdapter(LaborAdapterInterface):
     """
@@ -25,28 +89,49 @@ class AlldataScraperAdapter(LaborAdapterInterface):
     """
 
     async def get_labor_time(self, vin: str, job_description: str) -> Optional[LaborTimeResult]:
-        logger.info(f"ALLDATA SCRAPER: Fetching labor for VIN={vin}, Job={job_description}")
+        return await cached_call(
+            _labor_cache,
+            (vin, job_description.lower().strip()),
+            lambda: self._scrape_labor_time(vin, job_description),
+            # Don't pin fallback estimates - retry the live scrape next time
+            store=lambda result: (
+                result is not None
+                and result.source not in ("alldata-fallback", "alldata-estimated")
+            )
+        )
+
+    async def get_labor_times_batch(
+        self,
+        items: List[Tuple[str, str]],
+        concurrency: int = CDP_PAGE_POOL_SIZE
+    ) -> List[Optional[LaborTimeResult]]:
+        """Scrape several jobs in parallel CDP tabs, one per pooled page."""
+        return await super().get_labor_times_batch(items, concurrency)
+
+    async def _scrape_labor_time(self, vin: str, job_description: str) -> Optional[LaborTimeResult]:
+        global _last_failure
+        logger.info("ALLDATA SCRAPER: Fetching labor for VIN=%s, Job=%s", vin, job_description)
         
         # Check credentials
         if not settings.ALLDATA_USERNAME or not settings.ALLDATA_PASSWORD:
             logger.error("ALLDATA SCRAPER: Missing credentials!")
             return await self._get_fallback_data(job_description)
         
+        if time.monotonic() - _last_failure < FAILURE_COOLDOWN_SECONDS:
+            logger.warning("ALLDATA: Recent scrape failure, using estimate until cooldown ends")
+            return await self._get_fallback_data(job_description)
+        
+        if settings.ALLDATA_LABOR_API_URL:
+            result = await self._fetch_labor_from_api(vin, job_description)
+            if result:
+                return result
+        
         try:
-            from app.utils.scraper_utils import (
-                get_cdp_connection,
-                human_delay,
-                safe_navigate,
-                safe_fill,
-                safe_click,
-                take_debug_screenshot,
-                check_session_status
-            )
+            page = await acquire_cdp_page()
             
-            browser, context, page = await get_cdp_connection()
-            
-            if not browser:
+            if not page:
                 logger.error("ALLDATA: CDP connection failed. Run start_chrome.bat first!")
+                _last_failure = time.monotonic()
                 return await self._get_fallback_data(job_description)
             
             try:
@@ -61,33 +146,25 @@ class AlldataScraperAdapter(LaborAdapterInterface):
                     logger.info("ALLDATA: Not logged in. Attempting auto-login...")
                     
                     try:
-                        # Wait for login form
-                        await page.wait_for_selector(
-                            "input[autocomplete='username'], #username, input[name='username']", 
-                            timeout=10000
-                        )
+                        username_input = page.locator(USERNAME_SELECTOR).first
+                        password_input = page.locator(PASSWORD_SELECTOR).first
+                        
+                        # Wait for both login fields at once; if either never
+                        # shows up the other wait is cancelled
+                        try:
+                            async with asyncio.TaskGroup() as tg:
+                                tg.create_task(username_input.wait_for(timeout=10000))
+                                tg.create_task(password_input.wait_for(timeout=10000))
+                        except* PlaywrightError as wait_errors:
+                            raise wait_errors.exceptions[0]
                         
-                        # Fill credentials
-                        username_selectors = ["#username", "input[name='username']", "input[autocomplete='username']"]
-                        for sel in username_selectors:
-                            try:
-                                if await page.is_visible(sel):
-                                    await page.fill(sel, settings.ALLDATA_USERNAME)
-                                    break
-                            except:
-                                continue
+                        # Fill one at a time - both fills drive the same keyboard focus
+                        await username_input.fill(settings.ALLDATA_USERNAME)
                         
                         await human_delay(300, 600)
                         
                         # Password
-                        password_selectors = ["#password", "input[name='password']", "input[type='password']"]
-                        for sel in password_selectors:
-                            try:
-                                if await page.is_visible(sel):
-                                    await page.fill(sel, settings.ALLDATA_PASSWORD)
-                                    break
-                            except:
-                                continue
+                        await password_input.fill(settings.ALLDATA_PASSWORD)
                         
                         await human_delay(300, 600)
                         
@@ -95,11 +172,13 @@ class AlldataScraperAdapter(LaborAdapterInterface):
                         await safe_click(page, "#login-btn, button[type='submit'], .login-button")
                         
                         # Wait for dashboard
-                        await page.wait_for_selector(".dashboard, #main-content", timeout=60000)
+                        await page.wait_for_load_state("domcontentloaded")
+                        await expect(page.locator(DASHBOARD_SELECTOR).first).to_be_visible(timeout=60000)
                         logger.info("ALLDATA: Login successful!")
                         
-                    except Exception as login_err:
-                        logger.warning(f"ALLDATA: Auto-login failed ({login_err}). Please login manually.")
+                    # expect() signals a timeout with AssertionError
+                    except (AssertionError, PlaywrightError) as login_err:
+                        logger.warning("ALLDATA: Auto-login failed (%s). Please login manually.", login_err)
                         await take_debug_screenshot(page, "alldata_login_fail")
                 
                 # VIN Search
@@ -107,35 +186,24 @@ class AlldataScraperAdapter(LaborAdapterInterface):
                     await human_delay(500, 1000)
                     
                     # Wait for search input
-                    vin_selectors = ["#vin-search", "input[name='vin']", "#vin-input", ".vin-search-input"]
-                    
-                    vin_filled = False
-                    for vin_sel in vin_selectors:
-                        try:
-                            await page.wait_for_selector(vin_sel, timeout=10000)
-                            await page.fill(vin_sel, "")
-                            await human_delay(200, 400)
-                            await page.fill(vin_sel, vin)
-                            vin_filled = True
-                            logger.info(f"ALLDATA: Filled VIN using {vin_sel}")
-                            break
-                        except:
-                            continue
-                    
-                    if not vin_filled:
+                    vin_input = page.locator(VIN_SELECTOR).first
+                    try:
+                        await expect(vin_input).to_be_visible(timeout=10000)
+                        await vin_input.fill("")
+                    except (AssertionError, PlaywrightError):
                         raise Exception("Could not find VIN search input")
                     
+                    await human_delay(200, 400)
+                    await vin_input.fill(vin)
+                    logger.info("ALLDATA: Filled VIN")
+                    
                     # Click search
-                    search_btn_selectors = ["#search-btn", "button.search", "#vin-search-btn", "[type='submit']"]
-                    for btn_sel in search_btn_selectors:
-                        try:
-                            if await page.is_visible(btn_sel):
-                                await page.click(btn_sel)
-                                break
-                        except:
-                            continue
+                    search_btn = page.locator(SEARCH_BUTTON_SELECTOR).first
+                    if await search_btn.count():
+                        await search_btn.click()
                     
-                    # Wait for vehicle results
+                    # Pause like a user would (stealth mode only); the labor
+                    # lookup below waits for the results to actually render
                     await human_delay(2000, 4000)
                     
                     # Now search for the job/operation
@@ -143,37 +211,27 @@ class AlldataScraperAdapter(LaborAdapterInterface):
                     
                     # Try to find labor time in the interface
                     labor_time = None
-                    labor_selectors = [
-                        ".labor-time", 
-                        ".time-value",
-                        "[data-labor-time]",
-                        ".hours"
-                    ]
+                    labor_cell = page.locator(LABOR_TIME_SELECTOR).first
                     
-                    for labor_sel in labor_selectors:
-                        try:
-                            if await page.is_visible(labor_sel):
-                                time_text = await page.inner_text(labor_sel)
-                                import re
-                                time_match = re.search(r'(\d+\.?\d*)', time_text)
-                                if time_match:
-                                    labor_time = Decimal(time_match.group(1))
-                                    break
-                        except:
-                            continue
+                    try:
+                        await labor_cell.wait_for(state="attached", timeout=4000)
+                        time_text = await labor_cell.inner_text()
+                        time_match = LABOR_HOURS_PATTERN.search(time_text)
+                        if time_match:
+                            labor_time = Decimal(time_match.group(1))
+                    except PlaywrightError:
+                        pass
                     
-                    if not labor_time:
+                    scraped = bool(labor_time)
+                    if not scraped:
                         # Default fallback time based on job type
                         labor_time = self._estimate_labor_time(job_description)
-                        logger.warning(f"ALLDATA: Could not scrape labor time, using estimate: {labor_time}h")
-                    
-                    # Close the tab (not browser)
-                    await page.close()
+                        logger.warning("ALLDATA: Could not scrape labor time, using estimate: %sh", labor_time)
                     
                     return LaborTimeResult(
                         jobDescription=job_description,
                         laborHours=labor_time,
-                        source="alldata-scraped" if labor_time else "alldata-estimated",
+                        source="alldata-scraped" if scraped else "alldata-estimated",
                         category="Scraped",
                         difficulty="Medium"
                     )
@@ -181,50 +239,84 @@ class AlldataScraperAdapter(LaborAdapterInterface):
                 except Exception as search_err:
                     curr_url = page.url
                     await take_debug_screenshot(page, "alldata_search_fail")
-                    logger.error(f"ALLDATA SEARCH FAILED. URL: {curr_url}, Error: {search_err}")
+                    logger.error("ALLDATA SEARCH FAILED. URL: %s, Error: %s", curr_url, search_err)
                     raise
                     
             finally:
-                # Don't close browser - keep session alive
-                try:
-                    await page.close()
-                except:
-                    pass
+                # Don't close browser - keep session alive, recycle the tab
+                await release_cdp_page(page)
                     
         except Exception as e:
-            logger.error(f"ALLDATA SCRAPER ERROR: {e}")
+            logger.error("ALLDATA SCRAPER ERROR: %s", e)
+            _last_failure = time.monotonic()
             return await self._get_fallback_data(job_description)
 
+    async def _fetch_labor_from_api(self, vin: str, job_description: str) -> Optional[LaborTimeResult]:
+        """
+        Ask ALLDATA's labor JSON endpoint directly, authenticated with the CDP
+        session's cookies. Skips rendering the dashboard entirely.
+        
+        Returns:
+            Labor time result, or None to fall through to the browser scrape
+            (no session, expired session, or an unexpected response)
+        """
+        try:
+            cookies = await get_cdp_cookies("https://my.alldata.com")
+        except PlaywrightError:
+            return None
+        if not cookies:
+            return None
+        
+        # Session cookies go in an explicit header, which takes precedence
+        # over the shared client's cookie jar
+        cookie_header = "; ".join(f"{name}={value}" for name, value in cookies.items())
+        try:
+            response = await get_http_client().get(
+                settings.ALLDATA_LABOR_API_URL,
+                params={"vin": vin, "q": job_description},
+                headers={"Cookie": cookie_header},
+                timeout=15.0
+            )
+        except httpx.HTTPError as e:
+            logger.warning("ALLDATA API: Request failed (%s), using browser", e)
+            return None
+        
+        if response.status_code == 401:
+            # Session expired - the browser path logs in again
+            logger.info("ALLDATA API: Session expired, using browser")
+            return None
+        if response.status_code != 200:
+            logger.warning("ALLDATA API: HTTP %s, using browser", response.status_code)
+            return None
+        
+        try:
+            data = response.json()
+            hours = data.get("laborHours", data.get("hours"))
+            if hours is None:
+                return None
+            labor_hours = Decimal(str(hours))
+        except (ValueError, AttributeError, ArithmeticError):
+            logger.warning("ALLDATA API: Unexpected response body, using browser")
+            return None
+        
+        return LaborTimeResult(
+            jobDescription=job_description,
+            laborHours=labor_hours,
+            source="alldata-api",
+            category="Scraped",
+            difficulty="Medium"
+        )
+
     def _estimate_labor_time(self, job_description: str) -> Decimal:
         """Estimate labor time based on job description keywords"""
         job_lower = job_description.lower()
         
-        # Common job time estimates
-        estimates = {
-            'brake pad': Decimal('1.2'),
-            'brake rotor': Decimal('2.0'),
-            'oil change': Decimal('0.5'),
-            'spark plug': Decimal('1.5'),
-            'battery': Decimal('0.3'),
-            'alternator': Decimal('1.5'),
-            'starter': Decimal('1.8'),
-            'water pump': Decimal('3.0'),
-            'timing belt': Decimal('4.5'),
-            'transmission fluid': Decimal('1.0'),
-            'ac compressor': Decimal('3.5'),
-            'strut': Decimal('2.5'),
-            'shock': Decimal('1.5'),
-            'tie rod': Decimal('1.2'),
-            'ball joint': Decimal('2.0'),
-            'wheel bearing': Decimal('2.5'),
-        }
-        
-        for keyword, hours in estimates.items():
-            if keyword in job_lower:
-                return hours
+        keyword = LABOR_ESTIMATE_MATCHER.first(job_lower)
+        if keyword:
+            return LABOR_ESTIMATES[keyword]
         
         # Default estimate
-        return Decimal('1.5')
+        return DEFAULT_LABOR_ESTIMATE
 
     async def _get_fallback_data(self, job_description: str) -> LaborTimeResult:
         """Return fallback data when scraping fails"""
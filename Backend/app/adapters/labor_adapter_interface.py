@@ -4,9 +4,10 @@ Labor Adapter Interface
 Abstract interface for labor time lookup services.
 This allows easy switching between mock and real implementations (ALLDATA).
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 from decimal import Decimal
 
 
@@ -18,8 +19,11 @@ class LaborTimeResult(BaseModel):
     category: Optional[str] = Field(None, description="Job category")
     difficulty: Optional[str] = Field(None, description="Difficulty level")
     
-    class Config:
-        json_schema_extra = {
+    # Immutable so adapters can hand out shared, pre-built instances
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        json_schema_extra={
             "example": {
                 "jobDescription": "Brake Pad Replacement - Front",
                 "laborHours": "1.5",
@@ -28,6 +32,7 @@ class LaborTimeResult(BaseModel):
                 "difficulty": "Medium"
             }
         }
+    )
 
 
 class LaborAdapterInterface(ABC):
@@ -50,3 +55,26 @@ class LaborAdapterInterface(ABC):
             Labor time result or None if not found
         """
         pass
+
+    async def get_labor_times_batch(
+        self,
+        items: List[Tuple[str, str]],
+        concurrency: int = 10
+    ) -> List[Optional[LaborTimeResult]]:
+        """
+        Run get_labor_time for several (vin, job_description) pairs concurrently.
+        
+        Args:
+            items: (vin, job_description) pairs
+            concurrency: Maximum lookups in flight at once
+            
+        Returns:
+            Labor time results, in the same order as items
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_one(vin: str, job_description: str):
+            async with semaphore:
+                return await self.get_labor_time(vin, job_description)
+
+        return await asyncio.gather(*(run_one(vin, job) for vin, job in items))
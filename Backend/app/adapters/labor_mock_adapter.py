@@ -6,127 +6,84 @@ Returns hardcoded labor times for common jobs.
 
 This will be replaced with ALLDATA adapter when API keys are available.
 """
-from typing import Optional, Dict
+import functools
+from dataclasses import dataclass
+from typing import Optional, Dict, List, Tuple
 from decimal import Decimal
 from app.adapters.labor_adapter_interface import LaborAdapterInterface, LaborTimeResult
+from app.utils.keyword_matcher import KeywordMatcher
+
+
+@dataclass(slots=True, frozen=True)
+class LaborEntry:
+    """One row of the mock labor table"""
+    hours: Decimal
+    category: str
+    difficulty: str
+    description: str
 
 
 class LaborMockAdapter(LaborAdapterInterface):
     """Mock adapter for labor time lookup"""
     
     # Hardcoded labor times for common jobs (in hours)
-    LABOR_DATABASE: Dict[str, Dict] = {
+    LABOR_DATABASE: Dict[str, LaborEntry] = {
         # Brake Jobs
-        "brake pad": {
-            "hours": Decimal("1.5"),
-            "category": "Brakes",
-            "difficulty": "Medium",
-            "description": "Brake Pad Replacement"
-        },
-        "brake rotor": {
-            "hours": Decimal("2.0"),
-            "category": "Brakes",
-            "difficulty": "Medium",
-            "description": "Brake Rotor Replacement"
-        },
-        "brake caliper": {
-            "hours": Decimal("1.8"),
-            "category": "Brakes",
-            "difficulty": "Medium",
-            "description": "Brake Caliper Replacement"
-        },
+        "brake pad": LaborEntry(Decimal("1.5"), "Brakes", "Medium", "Brake Pad Replacement"),
+        "brake rotor": LaborEntry(Decimal("2.0"), "Brakes", "Medium", "Brake Rotor Replacement"),
+        "brake caliper": LaborEntry(Decimal("1.8"), "Brakes", "Medium", "Brake Caliper Replacement"),
         
         # Oil & Fluids
-        "oil change": {
-            "hours": Decimal("0.5"),
-            "category": "Maintenance",
-            "difficulty": "Easy",
-            "description": "Oil Change"
-        },
-        "transmission fluid": {
-            "hours": Decimal("1.0"),
-            "category": "Maintenance",
-            "difficulty": "Medium",
-            "description": "Transmission Fluid Change"
-        },
-        "coolant flush": {
-            "hours": Decimal("1.2"),
-            "category": "Cooling System",
-            "difficulty": "Medium",
-            "description": "Coolant Flush"
-        },
+        "oil change": LaborEntry(Decimal("0.5"), "Maintenance", "Easy", "Oil Change"),
+        "transmission fluid": LaborEntry(Decimal("1.0"), "Maintenance", "Medium", "Transmission Fluid Change"),
+        "coolant flush": LaborEntry(Decimal("1.2"), "Cooling System", "Medium", "Coolant Flush"),
         
         # Timing Belt
-        "timing belt": {
-            "hours": Decimal("4.5"),
-            "category": "Engine",
-            "difficulty": "Hard",
-            "description": "Timing Belt Replacement"
-        },
+        "timing belt": LaborEntry(Decimal("4.5"), "Engine", "Hard", "Timing Belt Replacement"),
         
         # Suspension
-        "shock absorber": {
-            "hours": Decimal("2.5"),
-            "category": "Suspension",
-            "difficulty": "Medium",
-            "description": "Shock Absorber Replacement"
-        },
-        "strut": {
-            "hours": Decimal("3.0"),
-            "category": "Suspension",
-            "difficulty": "Hard",
-            "description": "Strut Replacement"
-        },
+        "shock absorber": LaborEntry(Decimal("2.5"), "Suspension", "Medium", "Shock Absorber Replacement"),
+        "strut": LaborEntry(Decimal("3.0"), "Suspension", "Hard", "Strut Replacement"),
         
         # Battery & Electrical
-        "battery": {
-            "hours": Decimal("0.3"),
-            "category": "Electrical",
-            "difficulty": "Easy",
-            "description": "Battery Replacement"
-        },
-        "alternator": {
-            "hours": Decimal("2.0"),
-            "category": "Electrical",
-            "difficulty": "Medium",
-            "description": "Alternator Replacement"
-        },
-        "starter": {
-            "hours": Decimal("1.5"),
-            "category": "Electrical",
-            "difficulty": "Medium",
-            "description": "Starter Replacement"
-        },
+        "battery": LaborEntry(Decimal("0.3"), "Electrical", "Easy", "Battery Replacement"),
+        "alternator": LaborEntry(Decimal("2.0"), "Electrical", "Medium", "Alternator Replacement"),
+        "starter": LaborEntry(Decimal("1.5"), "Electrical", "Medium", "Starter Replacement"),
         
         # Tires
-        "tire rotation": {
-            "hours": Decimal("0.5"),
-            "category": "Tires",
-            "difficulty": "Easy",
-            "description": "Tire Rotation"
-        },
-        "tire replacement": {
-            "hours": Decimal("1.0"),
-            "category": "Tires",
-            "difficulty": "Easy",
-            "description": "Tire Replacement (Set of 4)"
-        },
+        "tire rotation": LaborEntry(Decimal("0.5"), "Tires", "Easy", "Tire Rotation"),
+        "tire replacement": LaborEntry(Decimal("1.0"), "Tires", "Easy", "Tire Replacement (Set of 4)"),
         
         # Air Filters
-        "air filter": {
-            "hours": Decimal("0.3"),
-            "category": "Maintenance",
-            "difficulty": "Easy",
-            "description": "Engine Air Filter Replacement"
-        },
-        "cabin filter": {
-            "hours": Decimal("0.3"),
-            "category": "Maintenance",
-            "difficulty": "Easy",
-            "description": "Cabin Air Filter Replacement"
-        },
+        "air filter": LaborEntry(Decimal("0.3"), "Maintenance", "Easy", "Engine Air Filter Replacement"),
+        "cabin filter": LaborEntry(Decimal("0.3"), "Maintenance", "Easy", "Cabin Air Filter Replacement"),
+    }
+    
+    DEFAULT_HOURS = Decimal("1.0")  # Default 1 hour for unmatched jobs
+    
+    # Compiled once at class creation; one regex scan per lookup
+    _MATCHER = KeywordMatcher(LABOR_DATABASE)
+    
+    # Results are static, so validate them once and share the frozen instances
+    _RESULTS: Dict[str, LaborTimeResult] = {
+        keyword: LaborTimeResult(
+            jobDescription=entry.description,
+            laborHours=entry.hours,
+            source="mock",
+            category=entry.category,
+            difficulty=entry.difficulty
+        )
+        for keyword, entry in LABOR_DATABASE.items()
     }
     
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _lookup(job_description: str) -> Optional[LaborTimeResult]:
+        """Return the pre-built result for a job description, if any."""
+        # Lowercased inside the cache, so repeated queries skip it entirely
+        keyword = LaborMockAdapter._MATCHER.first(job_description.lower())
+        return LaborMockAdapter._RESULTS[keyword] if keyword else None
+    
     async def get_labor_time(
         self,
         vin: str,
@@ -142,25 +99,24 @@ class LaborMockAdapter(LaborAdapterInterface):
         Returns:
             Labor time result or None if not found
         """
-        # Convert to lowercase for case-insensitive matching
-        search_term = job_description.lower()
-        
-        # Try to find matching job by keyword
-        for keyword, job_data in self.LABOR_DATABASE.items():
-            if keyword in search_term:
-                return LaborTimeResult(
-                    jobDescription=job_data["description"],
-                    laborHours=job_data["hours"],
-                    source="mock",
-                    category=job_data["category"],
-                    difficulty=job_data["difficulty"]
-                )
+        # Try to find matching job by keyword (case-insensitive)
+        result = self._lookup(job_description)
+        if result:
+            return result
         
         # If no match found, return a default estimate
         return LaborTimeResult(
             jobDescription=job_description,
-            laborHours=Decimal("1.0"),  # Default 1 hour
+            laborHours=self.DEFAULT_HOURS,
             source="mock",
             category="General",
             difficulty="Unknown"
         )
+    
+    async def get_labor_times_batch(
+        self,
+        items: List[Tuple[str, str]],
+        concurrency: int = 10
+    ) -> List[Optional[LaborTimeResult]]:
+        """Look up several jobs. Pure in-memory, so no tasks are needed."""
+        return [await self.get_labor_time(vin, job) for vin, job in items]
@@ -4,9 +4,10 @@ Parts Adapter Interface
 Abstract interface for parts lookup services.
 This allows easy switching between mock and real implementations (PartsLink24).
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 from decimal import Decimal
 
 
@@ -19,8 +20,11 @@ class PartResult(BaseModel):
     isOEM: bool = Field(default=False, description="Is OEM part")
     category: Optional[str] = Field(None, description="Part category")
     
-    class Config:
-        json_schema_extra = {
+    # Immutable so adapters can hand out shared, pre-built instances
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        json_schema_extra={
             "example": {
                 "partNumber": "45022-SDA-A00",
                 "description": "Brake Pad Set - Front",
@@ -30,6 +34,7 @@ class PartResult(BaseModel):
                 "category": "Brakes"
             }
         }
+    )
 
 
 class PartsAdapterInterface(ABC):
@@ -52,3 +57,26 @@ class PartsAdapterInterface(ABC):
             List of matching parts
         """
         pass
+
+    async def search_parts_batch(
+        self,
+        items: List[Tuple[str, str]],
+        concurrency: int = 10
+    ) -> List[List[PartResult]]:
+        """
+        Run search_parts for several (vin, job_description) pairs concurrently.
+        
+        Args:
+            items: (vin, job_description) pairs
+            concurrency: Maximum lookups in flight at once
+            
+        Returns:
+            Parts lists, in the same order as items
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_one(vin: str, job_description: str):
+            async with semaphore:
+                return await self.search_parts(vin, job_description)
+
+        return await asyncio.gather(*(run_one(vin, job) for vin, job in items))
@@ -6,9 +6,16 @@ Returns hardcoded parts for common jobs.
 
 This will be replaced with PartsLink24 adapter when API keys are available.
 """
-from typing import List, Dict
+import functools
+from typing import List, Dict, Tuple
 from decimal import Decimal
+from pydantic import TypeAdapter
 from app.adapters.parts_adapter_interface import PartsAdapterInterface, PartResult
+from app.utils.keyword_matcher import KeywordMatcher
+
+
+# Validates a whole list of part dicts in one call
+_PART_LIST_ADAPTER = TypeAdapter(List[PartResult])
 
 
 class PartsMockAdapter(PartsAdapterInterface):
@@ -177,6 +184,36 @@ class PartsMockAdapter(PartsAdapterInterface):
         ],
     }
     
+    # Compiled once at class creation; one regex scan per search
+    _MATCHER = KeywordMatcher(PARTS_DATABASE)
+    
+    # Results are static, so validate them once and share the frozen instances
+    _RESULTS: Dict[str, Tuple[PartResult, ...]] = {
+        keyword: tuple(_PART_LIST_ADAPTER.validate_python(parts_list))
+        for keyword, parts_list in PARTS_DATABASE.items()
+    }
+    
+    # Template for unmatched searches; only the description varies per call
+    _GENERIC_PART = PartResult(
+        partNumber="GEN-001",
+        description="Generic Part",
+        manufacturer="Generic",
+        price=Decimal("50.00"),
+        isOEM=False,
+        category="General"
+    )
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _lookup(job_description: str) -> Tuple[PartResult, ...]:
+        """Return the pre-built parts matching a job description."""
+        # Lowercased inside the cache, so repeated queries skip it entirely
+        return tuple(
+            part
+            for keyword in PartsMockAdapter._MATCHER.all(job_description.lower())
+            for part in PartsMockAdapter._RESULTS[keyword]
+        )
+    
     async def search_parts(
         self,
         vin: str,
@@ -192,26 +229,20 @@ class PartsMockAdapter(PartsAdapterInterface):
         Returns:
             List of matching parts
         """
-        # Convert to lowercase for case-insensitive matching
-        search_term = job_description.lower()
-        
-        results = []
-        
-        # Try to find matching parts by keyword
-        for keyword, parts_list in self.PARTS_DATABASE.items():
-            if keyword in search_term:
-                for part_data in parts_list:
-                    results.append(PartResult(**part_data))
+        # Try to find matching parts by keyword (case-insensitive)
+        results = self._lookup(job_description)
+        if results:
+            return list(results)
         
-        # If no match found, return a generic part
-        if not results:
-            results.append(PartResult(
-                partNumber="GEN-001",
-                description=f"Generic Part for: {job_description}",
-                manufacturer="Generic",
-                price=Decimal("50.00"),
-                isOEM=False,
-                category="General"
-            ))
-        
-        return results
+        # If no match found, return a generic part (copy skips re-validation)
+        return [self._GENERIC_PART.model_copy(
+            update={"description": f"Generic Part for: {job_description}"}
+        )]
+    
+    async def search_parts_batch(
+        self,
+        items: List[Tuple[str, str]],
+        concurrency: int = 10
+    ) -> List[List[PartResult]]:
+        """Search several jobs. Pure in-memory, so no tasks are needed."""
+        return [await self.search_parts(vin, job) for vin, job in items]
@@ -9,14 +9,93 @@ This is part of the Hybrid Approach:
 - Worldpac/SSF: Stealth Mode
 """
 
+import hashlib
 import logging
 from typing import List
 from decimal import Decimal
+from cachetools import TTLCache
+from playwright.async_api import Error as PlaywrightError, Page, TimeoutError as PlaywrightTimeoutError
 from app.adapters.parts_adapter_interface import PartsAdapterInterface, PartResult
 from app.core.config import settings
+from app.utils.async_cache import cached_call
+from app.utils.keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
+# Candidate selectors are joined into one CSS union so Playwright resolves the
+# first visible match in a single browser-side query instead of one CDP
+# round-trip per candidate.
+COMPANY_ID_CSS = "#login-id, input[name='companyId']"
+USERNAME_CSS = "#login-name, input[name='userName'], input[name='username']"
+PASSWORD_CSS = "#inputPassword, input[name='password'], input[type='password']"
+LOGIN_BUTTON_SELECTOR = "#login-btn, button[type='submit'], .login-button >> visible=true"
+VIN_SELECTOR = "#vin_input, input[name='vin'], #vinInput, .vin-input >> visible=true"
+VIN_SEARCH_BUTTON_SELECTOR = "#vin_search_btn, #vinSearchBtn, button.vin-search >> visible=true"
+PART_SEARCH_SELECTOR = "#search_term, #partSearch, input[name='search'] >> visible=true"
+PART_SEARCH_BUTTON_SELECTOR = "#search_btn, #partSearchBtn, button.part-search >> visible=true"
+OEM_NUMBER_CSS = ".oem-number, .part-number, [data-part-number], .article-number, .oe-number"
+MAIN_MENU_CSS = ".main_menu, #main-content"
+
+# Page-side helpers so multi-field steps (filling the login form, reading the
+# OEM cell) are one page.evaluate each instead of a locator count() plus an
+# action per field. Defined on demand by _plink_call rather than as an init
+# script: the CDP tab pool is shared with ALLDATA, and an init script would
+# stay on the tab for good.
+_PLINK_HELPERS_JS = """
+window.__plink = {
+    visible(css) {
+        for (const el of document.querySelectorAll(css)) {
+            if (el.offsetParent !== null) return el;
+        }
+        return null;
+    },
+    fill(css, value) {
+        const el = this.visible(css);
+        if (!el) return false;
+        el.focus();
+        el.value = value;
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        return true;
+    },
+    fillLogin(fields) {
+        return fields.map(([css, value]) => this.fill(css, value));
+    },
+    readOEM(css) {
+        const el = this.visible(css);
+        return el ? (el.innerText || '').trim().slice(0, 30) : null;
+    },
+};
+"""
+
+_PLINK_CALL_JS = (
+    "([method, arg]) => {\n"
+    "if (!window.__plink) {" + _PLINK_HELPERS_JS + "}\n"
+    "return window.__plink[method](arg);\n"
+    "}"
+)
+
+
+async def _plink_call(page: Page, method: str, arg):
+    """Call a __plink helper, defining it first if the current document lacks it."""
+    return await page.evaluate(_PLINK_CALL_JS, [method, arg])
+
+# OEM number prefixes for pseudo-realistic fallback part numbers
+OEM_PREFIXES = {
+    'brake': '34-',
+    'oil': '11-',
+    'air': '13-',
+    'spark': '12-',
+    'water': '11-',
+    'belt': '07-',
+}
+DEFAULT_OEM_PREFIX = '99-'
+OEM_PREFIX_MATCHER = KeywordMatcher(OEM_PREFIXES)
+
+# Scraped OEM parts keyed by (vin, normalized job). A VIN's catalogue doesn't
+# change within the hour, and each miss costs a full browser scrape.
+_parts_cache: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+
 
 class PartsLinkScraperAdapter(PartsAdapterInterface):
     """
@@ -26,6 +105,17 @@ class PartsLinkScraperAdapter(PartsAdapterInterface):
     """
 
     async def search_parts(self, vin: str, job_description: str) -> List[PartResult]:
+        parts = await cached_call(
+            _parts_cache,
+            (vin, job_description.lower().strip()),
+            lambda: self._scrape_parts(vin, job_description),
+            # Don't pin placeholder numbers - retry the live scrape next time
+            store=lambda parts: not any(part.category == "Needs Verification" for part in parts)
+        )
+        # Copy so callers can't alter the cached list
+        return list(parts)
+
+    async def _scrape_parts(self, vin: str, job_description: str) -> List[PartResult]:
         logger.info(f"PARTSLINK SCRAPER: Searching parts for VIN={vin}, Job={job_description}")
         
         # Check credentials
@@ -37,20 +127,26 @@ class PartsLinkScraperAdapter(PartsAdapterInterface):
         
         try:
             from app.utils.scraper_utils import (
-                get_cdp_connection,
+                acquire_cdp_page,
+                release_cdp_page,
+                block_heavy_resources,
+                wait_for_mutation,
                 human_delay,
                 safe_navigate,
                 take_debug_screenshot,
                 check_session_status
             )
             
-            browser, context, page = await get_cdp_connection()
+            page = await acquire_cdp_page()
             
-            if not browser:
+            if not page:
                 logger.error("PARTSLINK: CDP connection failed. Run start_chrome.bat first!")
                 return await self._get_fallback_data(job_description)
             
             try:
+                # Only text is read off PartsLink24 - skip images and fonts
+                await block_heavy_resources(page)
+                
                 # Navigate to PartsLink24
                 if not await safe_navigate(page, "https://www.partslink24.com/partslink24/p5.do"):
                     raise Exception("Failed to navigate to PartsLink24")
@@ -74,59 +170,27 @@ class PartsLinkScraperAdapter(PartsAdapterInterface):
                         # Wait for login form
                         await page.wait_for_selector("#login-id, #login-name, input[name='companyId']", timeout=10000)
                         
-                        # Fill 3-field login
-                        # 1. Company ID
-                        company_selectors = ["#login-id", "input[name='companyId']"]
-                        for sel in company_selectors:
-                            try:
-                                if await page.is_visible(sel):
-                                    await page.fill(sel, settings.PARTSLINK24_COMPANY_ID)
-                                    logger.info(f"PARTSLINK: Filled company ID using {sel}")
-                                    break
-                            except:
-                                continue
-                        
-                        await human_delay(200, 400)
-                        
-                        # 2. Username
-                        username_selectors = ["#login-name", "input[name='userName']", "input[name='username']"]
-                        for sel in username_selectors:
-                            try:
-                                if await page.is_visible(sel):
-                                    await page.fill(sel, settings.PARTSLINK24_USERNAME)
-                                    logger.info(f"PARTSLINK: Filled username using {sel}")
-                                    break
-                            except:
-                                continue
-                        
-                        await human_delay(200, 400)
-                        
-                        # 3. Password
-                        password_selectors = ["#inputPassword", "input[name='password']", "input[type='password']"]
-                        for sel in password_selectors:
-                            try:
-                                if await page.is_visible(sel):
-                                    await page.fill(sel, settings.PARTSLINK24_PASSWORD)
-                                    logger.info(f"PARTSLINK: Filled password using {sel}")
-                                    break
-                            except:
-                                continue
-                        
-                        await human_delay(500, 1000)
+                        # Fill 3-field login (company ID, username, password)
+                        filled = await _plink_call(
+                            page,
+                            "fillLogin",
+                            [
+                                [COMPANY_ID_CSS, settings.PARTSLINK24_COMPANY_ID],
+                                [USERNAME_CSS, settings.PARTSLINK24_USERNAME],
+                                [PASSWORD_CSS, settings.PARTSLINK24_PASSWORD],
+                            ]
+                        )
+                        logger.info(f"PARTSLINK: Filled login fields (company, user, password) = {filled}")
                         
                         # Click login
-                        login_selectors = ["#login-btn", "button[type='submit']", ".login-button"]
-                        for sel in login_selectors:
-                            try:
-                                if await page.is_visible(sel):
-                                    async with page.expect_navigation(timeout=30000):
-                                        await page.click(sel)
-                                    break
-                            except:
-                                continue
+                        login_btn = page.locator(LOGIN_BUTTON_SELECTOR).first
+                        if await login_btn.count():
+                            async with page.expect_navigation(timeout=30000):
+                                await login_btn.click()
                         
                         # Wait for main menu
-                        await page.wait_for_selector(".main_menu, #main-content", timeout=15000)
+                        if not await wait_for_mutation(page, MAIN_MENU_CSS, timeout=15000):
+                            raise Exception("Main menu did not appear after login")
                         logger.info("PARTSLINK: Login successful!")
                         
                     except Exception as login_err:
@@ -135,96 +199,64 @@ class PartsLinkScraperAdapter(PartsAdapterInterface):
                 
                 # VIN Search
                 try:
-                    await human_delay(500, 1000)
-                    
                     # Find VIN input
-                    vin_selectors = ["#vin_input", "input[name='vin']", "#vinInput", ".vin-input"]
-                    
-                    vin_filled = False
-                    for vin_sel in vin_selectors:
-                        try:
-                            await page.wait_for_selector(vin_sel, timeout=10000)
-                            await page.fill(vin_sel, "")
-                            await human_delay(200, 400)
-                            await page.fill(vin_sel, vin)
-                            vin_filled = True
-                            logger.info(f"PARTSLINK: Filled VIN using {vin_sel}")
-                            break
-                        except:
-                            continue
-                    
-                    if not vin_filled:
+                    vin_input = page.locator(VIN_SELECTOR).first
+                    try:
+                        await vin_input.wait_for(state="visible", timeout=10000)
+                    except PlaywrightTimeoutError:
                         raise Exception("Could not find VIN input")
                     
-                    # Click VIN search button
-                    vin_search_selectors = ["#vin_search_btn", "#vinSearchBtn", "button.vin-search"]
-                    for btn_sel in vin_search_selectors:
-                        try:
-                            if await page.is_visible(btn_sel):
-                                await page.click(btn_sel)
-                                break
-                        except:
-                            continue
-                    
-                    await human_delay(2000, 4000)
+                    await vin_input.fill(vin)
+                    logger.info("PARTSLINK: Filled VIN")
                     
-                    # Search for part in catalog
-                    search_selectors = ["#search_term", "#partSearch", "input[name='search']"]
+                    # Click VIN search button
+                    vin_search_btn = page.locator(VIN_SEARCH_BUTTON_SELECTOR).first
+                    if await vin_search_btn.count():
+                        await vin_search_btn.click()
                     
-                    search_filled = False
-                    for search_sel in search_selectors:
-                        try:
-                            if await page.is_visible(search_sel):
-                                await page.fill(search_sel, job_description)
-                                search_filled = True
-                                break
-                        except:
-                            continue
+                    # Wait for the vehicle's catalog to show its search box
+                    search_input = page.locator(PART_SEARCH_SELECTOR).first
+                    try:
+                        await search_input.wait_for(state="visible", timeout=10000)
+                    except PlaywrightTimeoutError:
+                        logger.warning("PARTSLINK: Part search box did not appear")
                     
-                    if search_filled:
-                        # Click search button
-                        part_search_selectors = ["#search_btn", "#partSearchBtn", "button.part-search"]
-                        for btn_sel in part_search_selectors:
-                            try:
-                                if await page.is_visible(btn_sel):
-                                    await page.click(btn_sel)
-                                    break
-                            except:
-                                continue
+                    if await search_input.count():
+                        await search_input.fill(job_description)
                         
-                        await human_delay(2000, 4000)
+                        # Click search button
+                        part_search_btn = page.locator(PART_SEARCH_BUTTON_SELECTOR).first
+                        if await part_search_btn.count():
+                            await part_search_btn.click()
                     
                     # Try to extract OEM part number
-                    results = []
                     oem_number = None
                     
-                    oem_selectors = [
-                        ".oem-number",
-                        ".part-number",
-                        "[data-part-number]",
-                        ".article-number",
-                        ".oe-number"
-                    ]
-                    
-                    for oem_sel in oem_selectors:
+                    try:
+                        await wait_for_mutation(page, OEM_NUMBER_CSS, timeout=10000)
+                    except PlaywrightError:
+                        # The search click navigated and destroyed the wait's
+                        # context; wait again on the results page
                         try:
-                            if await page.is_visible(oem_sel):
-                                oem_number = await page.inner_text(oem_sel)
-                                oem_number = oem_number.strip()[:30]  # Clean and truncate
-                                if oem_number:
-                                    logger.info(f"PARTSLINK: Found OEM number {oem_number}")
-                                    break
-                        except:
-                            continue
+                            await page.wait_for_load_state("domcontentloaded", timeout=10000)
+                            await wait_for_mutation(page, OEM_NUMBER_CSS, timeout=10000)
+                        except PlaywrightError:
+                            pass
+                    
+                    try:
+                        oem_number = await _plink_call(page, "readOEM", OEM_NUMBER_CSS)
+                        if oem_number:
+                            logger.info(f"PARTSLINK: Found OEM number {oem_number}")
+                    except PlaywrightError:
+                        pass
                     
+                    category = "Hard Parts"
                     if not oem_number:
-                        # Generate placeholder OEM
+                        # Generate placeholder OEM; flagged so it isn't cached as a real number
                         oem_number = f"OEM-{vin[-6:]}"
+                        category = "Needs Verification"
                         logger.warning(f"PARTSLINK: Could not find OEM, using placeholder: {oem_number}")
-                    
-                    # Close tab
-                    await page.close()
-                    
+
                     return [
                         PartResult(
                             partNumber=oem_number,
@@ -232,7 +264,7 @@ class PartsLinkScraperAdapter(PartsAdapterInterface):
                             manufacturer="Genuine OEM",
                             price=Decimal("0.00"),  # PartsLink shows list price, not retail
                             isOEM=True,
-                            category="Hard Parts"
+                            category=category
                         )
                     ]
                     
@@ -242,10 +274,8 @@ class PartsLinkScraperAdapter(PartsAdapterInterface):
                     raise
                     
             finally:
-                try:
-                    await page.close()
-                except:
-                    pass
+                # Keep the session alive, recycle the tab
+                await release_cdp_page(page)
                     
         except Exception as e:
             logger.error(f"PARTSLINK SCRAPER ERROR: {e}")
@@ -253,25 +283,17 @@ class PartsLinkScraperAdapter(PartsAdapterInterface):
 
     async def _get_fallback_data(self, job_description: str) -> List[PartResult]:
         """Return fallback data when scraping fails"""
-        import random
-        
         # Generate a pseudo-realistic OEM number
-        oem_prefix = {
-            'brake': '34-',
-            'oil': '11-',
-            'air': '13-',
-            'spark': '12-',
-            'water': '11-',
-            'belt': '07-',
-        }
-        
-        prefix = '99-'  # Default
-        for keyword, pref in oem_prefix.items():
-            if keyword in job_description.lower():
-                prefix = pref
-                break
+        keyword = OEM_PREFIX_MATCHER.first(job_description.lower())
+        prefix = OEM_PREFIXES[keyword] if keyword else DEFAULT_OEM_PREFIX
         
-        fake_oem = f"{prefix}{random.randint(100, 999)}-{random.randint(100, 999)}-{random.randint(10, 99)}"
+        # Derived from the job description rather than random, so the same job
+        # always gets the same placeholder and repeat requests stay cacheable
+        digest = hashlib.blake2b(job_description.encode(), digest_size=5).digest()
+        first = int.from_bytes(digest[:2], "big") % 900 + 100
+        second = int.from_bytes(digest[2:4], "big") % 900 + 100
+        third = digest[4] % 90 + 10
+        fake_oem = f"{prefix}{first}-{second}-{third}"
         
         return [
             PartResult(
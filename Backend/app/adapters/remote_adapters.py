@@ -12,15 +12,39 @@ The frontend should display proper error messages to the user.
 import logging
 from typing import Optional, List
 from decimal import Decimal
+from cachetools import TTLCache
 
 from app.adapters.labor_adapter_interface import LaborAdapterInterface, LaborTimeResult
 from app.adapters.parts_adapter_interface import PartsAdapterInterface, PartResult
 from app.adapters.vendor_adapter_interface import VendorAdapterInterface, VendorPriceResult
+from app.utils.async_cache import cached_call
 from app.utils.scraper_client import scraper_client
 
 
 logger = logging.getLogger(__name__)
 
+# Recent scraper responses keyed by (vin, normalized job). Repeated edits of
+# the same estimate re-request identical lookups, and each one is a full
+# remote scrape. Failures raise and are never cached.
+_labor_cache: TTLCache = TTLCache(maxsize=2048, ttl=900)
+_parts_cache: TTLCache = TTLCache(maxsize=2048, ttl=900)
+
+
+_ZERO = Decimal("0.00")
+
+
+def _to_money(value) -> Decimal:
+    """Convert a JSON number (string, int or float) from the scraper to Decimal."""
+    if value is None:
+        return _ZERO
+    if isinstance(value, Decimal):
+        return value
+    # Strings and ints convert exactly; only floats need the shortest-repr
+    # round-trip to avoid binary-float artifacts like 85.0999999...
+    if isinstance(value, (str, int)):
+        return Decimal(value)
+    return Decimal(repr(value))
+
 
 class ScraperServiceError(Exception):
     """Exception raised when Scraper Service fails"""
@@ -37,6 +61,13 @@ class RemoteLaborAdapter(LaborAdapterInterface):
     """
     
     async def get_labor_time(self, vin: str, job_description: str) -> Optional[LaborTimeResult]:
+        return await cached_call(
+            _labor_cache,
+            (vin, job_description.lower().strip()),
+            lambda: self._fetch_labor_time(vin, job_description)
+        )
+    
+    async def _fetch_labor_time(self, vin: str, job_description: str) -> LaborTimeResult:
         logger.info(f"REMOTE LABOR: Requesting from Scraper Service for VIN={vin}")
         
         result = await scraper_client.get_labor_time(vin, job_description)
@@ -44,7 +75,7 @@ class RemoteLaborAdapter(LaborAdapterInterface):
         if result.get("success"):
             return LaborTimeResult(
                 jobDescription=job_description,
-                laborHours=Decimal(str(result.get("labor_hours", 0))),
+                laborHours=_to_money(result.get("labor_hours")),
                 source=result.get("source", "ALLDATA"),
                 category="Remote Scraped",
                 difficulty="Medium"
@@ -62,6 +93,15 @@ class RemotePartsAdapter(PartsAdapterInterface):
     """
     
     async def search_parts(self, vin: str, job_description: str) -> List[PartResult]:
+        parts = await cached_call(
+            _parts_cache,
+            (vin, job_description.lower().strip()),
+            lambda: self._fetch_parts(vin, job_description)
+        )
+        # Copy so callers can't alter the cached list
+        return list(parts)
+    
+    async def _fetch_parts(self, vin: str, job_description: str) -> List[PartResult]:
         logger.info(f"REMOTE PARTS: Requesting from Scraper Service for VIN={vin}")
         
         result = await scraper_client.get_parts(vin, job_description)
@@ -76,7 +116,7 @@ class RemotePartsAdapter(PartsAdapterInterface):
                         partNumber=part_num,
                         description=p.get("description", job_description),
                         manufacturer=p.get("manufacturer", "OEM"),
-                        price=Decimal("0.00"),
+                        price=_ZERO,
                         isOEM=p.get("is_oem", True),
                         category="Remote Scraped"
                     ))
@@ -116,22 +156,22 @@ class RemoteVendorAdapter(VendorAdapterInterface):
         result = await scraper_client.get_pricing(valid_parts, vin=vin, job_description=job_description)
         
         if result.get("success"):
-            prices = []
-            for p in result.get("prices", []):
-                prices.append(VendorPriceResult(
+            return [
+                VendorPriceResult(
                     vendor_id=f"remote_{p.get('vendor', 'unknown')}",
                     vendor_name=p.get("vendor", "SSF"),
                     brand=p.get("brand", "Aftermarket"),
                     part_number=p.get("part_number", ""),
-                    price=Decimal(str(p.get("price", 0))),
+                    price=_to_money(p.get("price")),
                     stock_status=p.get("stock_status", "In Stock"),
                     stock_quantity=1,
                     warehouse_location=p.get("warehouse", "Remote"),
                     warehouse_distance_miles=0,
                     delivery_option="Standard",
                     warranty="Manufacturer"
-                ))
-            return prices
+                )
+                for p in result.get("prices", ())
+            ]
         else:
             error_msg = result.get('error', 'Unknown error')
             logger.error(f"REMOTE VENDOR: Scraper failed - {error_msg}")
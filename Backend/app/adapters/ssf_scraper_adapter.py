@@ -9,14 +9,49 @@ This is part of the Hybrid Approach:
 
 import logging
 import asyncio
-from typing import List
+import re
+from typing import AsyncIterator, List, Optional, Tuple
 from decimal import Decimal
 import random
+from urllib.parse import quote_plus
+from playwright.async_api import Browser, Error as PlaywrightError, Page, TimeoutError as PlaywrightTimeoutError
 from app.adapters.vendor_adapter_interface import VendorAdapterInterface, VendorPriceResult
 from app.core.config import settings
+from app.utils import price_cache
+from app.utils.scraper_utils import (
+    get_or_create_browser,
+    new_stealth_page,
+    load_auth_state,
+    save_auth_state,
+    human_delay,
+    human_type,
+    safe_navigate,
+    take_debug_screenshot,
+    check_session_status,
+    read_visible_texts
+)
 
 logger = logging.getLogger(__name__)
 
+# Candidate selectors are joined into one CSS union so Playwright resolves the
+# first visible match in a single browser-side query instead of one probe per
+# candidate. *_CSS are plain CSS for reads inside the page.
+USERNAME_SELECTOR = "input[placeholder='Account#/Username'], #username, input[name='username'], input[name='account'] >> visible=true"
+PASSWORD_SELECTOR = "input[placeholder='Password'], #password, input[name='password'], input[type='password'] >> visible=true"
+LOGIN_BUTTON_SELECTOR = "#user-login-submit-button, button[type='submit'], .login-button, input[type='submit'], #login-btn >> visible=true"
+LOGGED_IN_SELECTOR = ".account-menu, .user-menu, #logout, .welcome-user, #search >> visible=true"
+SEARCH_SELECTOR = "input[name='search'], #search, #keyword, input[placeholder*='Search'], input[placeholder*='Part'], .search-input, input[type='search'] >> visible=true"
+PRICE_CSS = ".price, .product-price, .item-price, [data-price], .cost, .amount, .your-price, .net-price"
+PRICE_SELECTOR = f"{PRICE_CSS} >> visible=true"
+BRAND_CSS = ".brand, .manufacturer, .product-brand, .vendor-name"
+STOCK_CSS = ".stock-status, .availability, .in-stock, .stock"
+
+# The SSF browser outlives each call; one call at a time drives its login page
+_session_lock = asyncio.Lock()
+
+# Number in a price cell like "$1,234.56" (commas are stripped before matching)
+PRICE_PATTERN = re.compile(r'[\d,]+\.?\d*')
+
 
 class SSFScraperAdapter(VendorAdapterInterface):
     """
@@ -24,33 +59,97 @@ class SSFScraperAdapter(VendorAdapterInterface):
     Scrapes pricing for specific part numbers with anti-detection.
     """
 
-    async def get_prices(self, part_numbers: List[str]) -> List[VendorPriceResult]:
+    async def get_prices(
+        self,
+        part_numbers: List[str],
+        vin: Optional[str] = None,
+        job_description: Optional[str] = None
+    ) -> List[VendorPriceResult]:
+        return [result async for result in self.stream_prices(part_numbers, vin=vin, job_description=job_description)]
+
+    async def stream_prices(
+        self,
+        part_numbers: List[str],
+        vin: Optional[str] = None,
+        job_description: Optional[str] = None
+    ) -> AsyncIterator[VendorPriceResult]:
+        # Serve recently scraped parts from the price cache; only scrape the rest
+        hits = await asyncio.gather(*[price_cache.get("ssf", part_num) for part_num in part_numbers])
+        cached = [hit for hit in hits if hit is not None]
+        to_scrape = [part_num for part_num, hit in zip(part_numbers, hits) if hit is None]
+        
+        if cached:
+            logger.info(f"SSF SCRAPER: {len(cached)} price(s) served from cache")
+        for result in cached:
+            yield result
+        
+        if to_scrape:
+            async for result in self._stream_scraped_prices(to_scrape):
+                yield result
+
+    async def _stream_scraped_prices(self, part_numbers: List[str]) -> AsyncIterator[VendorPriceResult]:
+        """Scrape parts in parallel contexts, yielding each part's offers as it finishes."""
         logger.info(f"SSF SCRAPER: Getting prices for {part_numbers}")
         
+        session = await self._open_session()
+        if session is None:
+            for result in await self._get_fallback_data(part_numbers):
+                yield result
+            return
+        browser, storage_state, search_url = session
+        
+        # Part searches run in parallel browser contexts, at most
+        # SCRAPE_CONCURRENCY at once to bound Chromium memory
+        semaphore = asyncio.Semaphore(settings.SCRAPE_CONCURRENCY or 4)
+        
+        async def scrape_part(part_num: str) -> List[VendorPriceResult]:
+            async with semaphore:
+                try:
+                    part_context, part_page = await new_stealth_page(browser, storage_state)
+                    try:
+                        direct_url = self._search_url(part_num)
+                        if not await safe_navigate(part_page, direct_url or search_url):
+                            raise Exception("Failed to navigate to SSF")
+                        return await self._scrape_part(part_page, part_num, submitted=direct_url is not None)
+                    finally:
+                        await part_context.close()
+                except Exception as e:
+                    # Handled per part so one failure doesn't end the stream
+                    logger.error(f"SSF: Error searching {part_num}: {e}")
+                    return await self._get_fallback_data([part_num])
+        
+        # Results stream out in completion order; closing the stream early
+        # cancels the scrapes still running and waits for their contexts to close
+        tasks = [asyncio.create_task(scrape_part(part_num)) for part_num in part_numbers]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for result in await next_done:
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _open_session(self) -> Optional[Tuple[Browser, dict, str]]:
+        """
+        Log the shared browser in and return (browser, storage_state,
+        search_url) for seeding per-part contexts, or None to fall back.
+        """
         # Check credentials
         if not settings.SSF_USERNAME or not settings.SSF_PASSWORD:
             logger.warning("SSF SCRAPER: Missing credentials! Using fallback data.")
-            return await self._get_fallback_data(part_numbers)
+            return None
         
         try:
-            from app.utils.scraper_utils import (
-                get_stealth_browser, 
-                human_delay, 
-                human_type,
-                safe_navigate,
-                take_debug_screenshot,
-                check_session_status
-            )
-            
-            browser, context, page = await get_stealth_browser()
+            # Reuse the running SSF browser; a fresh launch starts from the
+            # last saved login so check_session_status can skip the form
+            browser, context, page = await get_or_create_browser("ssf", storage_state=load_auth_state("ssf"))
             
             if not browser:
                 logger.error("SSF: Could not launch stealth browser")
-                return await self._get_fallback_data(part_numbers)
+                return None
             
-            try:
-                results = []
-                
+            async with _session_lock:
                 # Navigate to SSF
                 if not await safe_navigate(page, "https://shop.ssfautoparts.com/"):
                     raise Exception("Failed to navigate to SSF")
@@ -73,83 +172,39 @@ class SSFScraperAdapter(VendorAdapterInterface):
                         )
                         
                         # Username field
-                        username_selectors = [
-                            "input[placeholder='Account#/Username']",
-                            "#username",
-                            "input[name='username']",
-                            "input[name='account']"
-                        ]
-                        
-                        for user_sel in username_selectors:
-                            try:
-                                if await page.is_visible(user_sel):
-                                    await human_type(page, user_sel, settings.SSF_USERNAME)
-                                    logger.info(f"SSF: Filled username using {user_sel}")
-                                    break
-                            except:
-                                continue
+                        if await page.locator(USERNAME_SELECTOR).count():
+                            await human_type(page, USERNAME_SELECTOR, settings.SSF_USERNAME)
+                            logger.info("SSF: Filled username")
                         
                         await human_delay(300, 600)
                         
                         # Password field
-                        password_selectors = [
-                            "input[placeholder='Password']",
-                            "#password",
-                            "input[name='password']",
-                            "input[type='password']"
-                        ]
-                        
-                        for pass_sel in password_selectors:
-                            try:
-                                if await page.is_visible(pass_sel):
-                                    await human_type(page, pass_sel, settings.SSF_PASSWORD)
-                                    logger.info(f"SSF: Filled password using {pass_sel}")
-                                    break
-                            except:
-                                continue
+                        if await page.locator(PASSWORD_SELECTOR).count():
+                            await human_type(page, PASSWORD_SELECTOR, settings.SSF_PASSWORD)
+                            logger.info("SSF: Filled password")
                         
                         await human_delay(500, 1000)
                         
                         # Click login button
-                        login_selectors = [
-                            "#user-login-submit-button",
-                            "button[type='submit']",
-                            ".login-button",
-                            "input[type='submit']",
-                            "#login-btn"
-                        ]
-                        
-                        for btn_sel in login_selectors:
-                            try:
-                                if await page.is_visible(btn_sel):
-                                    await page.click(btn_sel)
-                                    logger.info(f"SSF: Clicked login using {btn_sel}")
-                                    break
-                            except:
-                                continue
-                        
-                        # Wait for navigation/page change
-                        await human_delay(3000, 5000)
+                        login_button = page.locator(LOGIN_BUTTON_SELECTOR).first
+                        if await login_button.count():
+                            await login_button.click()
+                            logger.info("SSF: Clicked login")
                         
                         # Verify login success
                         try:
-                            # Check for common logged-in indicators
-                            logged_in_indicators = [
-                                ".account-menu",
-                                ".user-menu", 
-                                "#logout",
-                                ".welcome-user",
-                                "#search"
-                            ]
-                            
-                            login_success = False
-                            for indicator in logged_in_indicators:
-                                if await page.is_visible(indicator):
-                                    login_success = True
-                                    logger.info(f"SSF: Login verified via {indicator}")
-                                    break
+                            # Wait for any common logged-in indicator rather than
+                            # a fixed pause for the navigation
+                            try:
+                                await page.locator(LOGGED_IN_SELECTOR).first.wait_for(timeout=5000)
+                                login_success = True
+                            except PlaywrightTimeoutError:
+                                login_success = False
                             
-                            if not login_success:
+                            if login_success:
+                                logger.info("SSF: Login verified")
+                                await save_auth_state("ssf", context)
+                            else:
                                 await take_debug_screenshot(page, "ssf_login_status")
                                 logger.warning("SSF: Login status unclear - continuing anyway")
                                 
@@ -161,175 +216,129 @@ class SSFScraperAdapter(VendorAdapterInterface):
                         logger.error(f"SSF: Login failed: {login_err}")
                         # Continue anyway - might still work
                 
-                # Now search for parts
-                for part_num in part_numbers:
-                    try:
-                        logger.info(f"SSF: Searching for part {part_num}")
-                        
-                        # Find search box
-                        search_selectors = [
-                            "input[name='search']",
-                            "#search",
-                            "#keyword",
-                            "input[placeholder*='Search']",
-                            "input[placeholder*='Part']",
-                            ".search-input",
-                            "input[type='search']"
-                        ]
-                        
-                        search_filled = False
-                        for search_sel in search_selectors:
-                            try:
-                                if await page.is_visible(search_sel):
-                                    await page.fill(search_sel, "")  # Clear first
-                                    await human_delay(200, 400)
-                                    await human_type(page, search_sel, part_num)
-                                    search_filled = True
-                                    logger.info(f"SSF: Filled search using {search_sel}")
-                                    break
-                            except:
-                                continue
-                        
-                        if not search_filled:
-                            logger.warning(f"SSF: Could not find search box for {part_num}")
-                            await take_debug_screenshot(page, f"ssf_no_search_{part_num}")
-                            fallback = await self._get_fallback_data([part_num])
-                            results.extend(fallback)
-                            continue
-                        
-                        # Submit search
-                        await human_delay(300, 600)
-                        await page.keyboard.press("Enter")
-                        
-                        # Wait for results
-                        await human_delay(3000, 5000)
-                        
-                        # Try to scrape price
-                        price = None
-                        price_selectors = [
-                            ".price",
-                            ".product-price", 
-                            ".item-price",
-                            "[data-price]",
-                            ".cost",
-                            ".amount",
-                            ".your-price",
-                            ".net-price"
-                        ]
-                        
-                        for price_sel in price_selectors:
-                            try:
-                                if await page.is_visible(price_sel):
-                                    price_text = await page.inner_text(price_sel)
-                                    # Extract number from text
-                                    import re
-                                    price_match = re.search(r'[\d,]+\.?\d*', price_text.replace(',', ''))
-                                    if price_match:
-                                        price = Decimal(price_match.group())
-                                        logger.info(f"SSF: Found price ${price} using {price_sel}")
-                                        break
-                            except:
-                                continue
-                        
-                        # Try to get brand
-                        brand = "SSF Aftermarket"
-                        brand_selectors = [
-                            ".brand",
-                            ".manufacturer",
-                            ".product-brand",
-                            ".vendor-name"
-                        ]
-                        for brand_sel in brand_selectors:
-                            try:
-                                if await page.is_visible(brand_sel):
-                                    brand = await page.inner_text(brand_sel)
-                                    brand = brand[:50]  # Truncate
-                                    break
-                            except:
-                                continue
-                        
-                        # Try to get stock status
-                        stock_status = "Check SSF Website"
-                        stock_selectors = [
-                            ".stock-status",
-                            ".availability",
-                            ".in-stock",
-                            ".stock"
-                        ]
-                        for stock_sel in stock_selectors:
-                            try:
-                                if await page.is_visible(stock_sel):
-                                    stock_status = await page.inner_text(stock_sel)
-                                    stock_status = stock_status[:30]  # Truncate
-                                    break
-                            except:
-                                continue
-                        
-                        # Create result
-                        if price and price > 0:
-                            results.append(VendorPriceResult(
-                                vendor_id=f"ssf_{random.randint(1000, 9999)}",
-                                vendor_name="SSF",
-                                brand=brand,
-                                part_number=part_num,
-                                price=price,
-                                stock_status=f"Live Scraped - {stock_status}",
-                                stock_quantity=1,
-                                warehouse_location="South San Francisco, CA",
-                                warehouse_distance_miles=0,
-                                delivery_option="See SSF Website",
-                                warranty="Manufacturer Warranty"
-                            ))
-                            logger.info(f"SSF: Successfully scraped {part_num} @ ${price}")
-                        else:
-                            logger.warning(f"SSF: No valid price for {part_num}")
-                            fallback = await self._get_fallback_data([part_num])
-                            results.extend(fallback)
-                        
-                    except Exception as part_err:
-                        logger.error(f"SSF: Error searching {part_num}: {part_err}")
-                        fallback = await self._get_fallback_data([part_num])
-                        results.extend(fallback)
-                
-                return results if results else await self._get_fallback_data(part_numbers)
-                
-            finally:
-                # Close browser
-                try:
-                    await browser.close()
-                except:
-                    pass
+                # Each part gets its own context, seeded with the logged-in
+                # session so it skips auth, and runs alongside the others
+                return browser, await context.storage_state(), page.url
                     
         except ImportError as ie:
             logger.error(f"SSF: Missing dependency: {ie}")
-            return await self._get_fallback_data(part_numbers)
+            return None
         except Exception as e:
             logger.error(f"SSF SCRAPER ERROR: {e}")
-            return await self._get_fallback_data(part_numbers)
+            return None
+
+    def _search_url(self, part_num: str) -> Optional[str]:
+        """Direct results URL for a part, or None to use the search box."""
+        if not settings.SSF_SEARCH_URL:
+            return None
+        return settings.SSF_SEARCH_URL.replace("{part}", quote_plus(part_num))
+
+    async def _scrape_part(self, page: Page, part_num: str, submitted: bool = False) -> List[VendorPriceResult]:
+        """Search one part number on a logged-in SSF page and scrape its offer.
+        
+        `submitted` means the page is already on this part's results (direct
+        search URL), so the search box is skipped.
+        """
+        logger.info(f"SSF: Searching for part {part_num}")
+        
+        if not submitted:
+            # Find search box
+            search_box = page.locator(SEARCH_SELECTOR).first
+        
+            try:
+                await search_box.wait_for(state="visible", timeout=3000)
+            except PlaywrightTimeoutError:
+                logger.warning(f"SSF: Could not find search box for {part_num}")
+                await take_debug_screenshot(page, f"ssf_no_search_{part_num}")
+                return await self._get_fallback_data([part_num])
+        
+            # Select-all and type over it: one call each to clear and to type,
+            # with the per-keystroke cadence kept in the browser
+            await search_box.click()
+            await search_box.press("Control+A")
+            await search_box.press_sequentially(part_num, delay=random.randint(40, 90) if settings.SCRAPER_STEALTH else 0)
+            logger.info("SSF: Filled search")
+        
+            # Submit search
+            await human_delay(300, 600)
+            await page.keyboard.press("Enter")
+        
+        # Wait for results to render instead of a fixed pause, then a short
+        # jitter to keep a human cadence
+        try:
+            await page.locator(PRICE_SELECTOR).first.wait_for(timeout=5000)
+        except PlaywrightTimeoutError:
+            await take_debug_screenshot(page, f"ssf_no_price_{part_num}")
+        await human_delay(200, 500)
+        
+        # Price, brand and stock cells in one round-trip
+        try:
+            cells = await read_visible_texts(page, {
+                "price": PRICE_CSS,
+                "brand": BRAND_CSS,
+                "stock": STOCK_CSS,
+            })
+        except PlaywrightError:
+            cells = {}
+        
+        price = None
+        if cells.get("price"):
+            # Extract number from text
+            price_match = PRICE_PATTERN.search(cells["price"].replace(',', ''))
+            if price_match:
+                price = Decimal(price_match.group())
+                logger.info(f"SSF: Found price ${price}")
+        
+        brand = (cells.get("brand") or "SSF Aftermarket")[:50]  # Truncate
+        stock_status = (cells.get("stock") or "Check SSF Website")[:30]  # Truncate
+        
+        # Create result
+        if price and price > 0:
+            logger.info(f"SSF: Successfully scraped {part_num} @ ${price}")
+            result = VendorPriceResult(
+                vendor_id=f"ssf_{random.randint(1000, 9999)}",
+                vendor_name="SSF",
+                brand=brand,
+                part_number=part_num,
+                price=price,
+                stock_status=f"Live Scraped - {stock_status}",
+                stock_quantity=1,
+                warehouse_location="South San Francisco, CA",
+                warehouse_distance_miles=0,
+                delivery_option="See SSF Website",
+                warranty="Manufacturer Warranty"
+            )
+            await price_cache.set("ssf", part_num, result)
+            return [result]
+        
+        logger.warning(f"SSF: No valid price for {part_num}")
+        return await self._get_fallback_data([part_num])
 
     async def _get_fallback_data(self, part_numbers: List[str]) -> List[VendorPriceResult]:
         """
         Return fallback data when scraping fails.
         Data is marked as requiring manual verification.
         """
-        await asyncio.sleep(1)  # Small delay
-        results = []
+        # Draw all ids and prices in one call each instead of per row
+        ids = random.choices(range(100, 1000), k=len(part_numbers))
+        prices = random.choices(range(60, 161), k=len(part_numbers))
         
-        for part in part_numbers:
-            base_price = Decimal(random.randint(60, 160))
-            results.append(VendorPriceResult(
-                vendor_id=f"ssf_fallback_{random.randint(100, 999)}",
+        results = [
+            VendorPriceResult(
+                vendor_id=f"ssf_fallback_{fallback_id}",
                 vendor_name="SSF",
                 brand="TBD - Manual Check Required",
                 part_number=part,
-                price=base_price,
+                price=Decimal(price),
                 stock_status="⚠️ REQUIRES MANUAL VERIFICATION",
                 stock_quantity=0,
                 warehouse_location="South San Francisco - Verify on SSF Site",
                 warehouse_distance_miles=22.0,
                 delivery_option="Manual Check Required",
                 warranty="Unknown"
-            ))
+            )
+            for part, fallback_id, price in zip(part_numbers, ids, prices)
+        ]
         
         logger.warning(f"SSF: Returned fallback data for {len(part_numbers)} parts - MANUAL VERIFICATION NEEDED")
         return results
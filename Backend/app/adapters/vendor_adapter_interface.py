@@ -1,5 +1,7 @@
+import asyncio
+import logging
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from decimal import Decimal
 from dataclasses import dataclass
 # We can import VendorOffer from vendor_service, but circular imports might be tricky.
@@ -8,7 +10,10 @@ from dataclasses import dataclass
 # Actually, VendorOffer is in services/vendor_service.py. Ideally it should be in schemas or models.
 # I will create a standalone DTO here to avoid circular dependency with service.
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Slotted (no per-instance __dict__) and immutable; adapters only construct these
+@dataclass(slots=True, frozen=True)
 class VendorPriceResult:
     vendor_id: str
     vendor_name: str
@@ -23,11 +28,72 @@ class VendorPriceResult:
     warranty: str
 
 class VendorAdapterInterface(ABC):
-    """Abstract interface for Vendor Pricing Scrapers (Worldpac, SSF, etc.)"""
+    """
+    Abstract interface for Vendor Pricing Scrapers (Worldpac, SSF, etc.)
+    
+    get_prices is run concurrently across vendors (see gather_prices), so
+    implementations must be safe to await in parallel with each other.
+    """
 
     @abstractmethod
-    async def get_prices(self, part_numbers: List[str]) -> List[VendorPriceResult]:
+    async def get_prices(
+        self,
+        part_numbers: List[str],
+        vin: Optional[str] = None,
+        job_description: Optional[str] = None
+    ) -> List[VendorPriceResult]:
         """
         Scrape pricing for valid OEM part numbers.
+        vin/job_description are passed for vendors that search by vehicle;
+        part-number-only vendors may ignore them.
         """
         pass
+
+    async def stream_prices(
+        self,
+        part_numbers: List[str],
+        vin: Optional[str] = None,
+        job_description: Optional[str] = None
+    ) -> AsyncIterator[VendorPriceResult]:
+        """
+        Yield offers as they become available, so callers can forward them
+        before the slowest part finishes. The default waits for get_prices;
+        scraping adapters override it to yield per part.
+        """
+        for result in await self.get_prices(part_numbers, vin=vin, job_description=job_description):
+            yield result
+
+
+async def gather_prices(
+    adapters: List[VendorAdapterInterface],
+    part_numbers: List[str],
+    vin: Optional[str] = None,
+    job_description: Optional[str] = None
+) -> List[VendorPriceResult]:
+    """
+    Query every vendor at once and merge their offers, so a lookup takes as
+    long as the slowest vendor rather than the sum of all of them.
+    A failing vendor is logged and skipped; if every vendor fails, the
+    first error is raised as before.
+    """
+    outcomes = await asyncio.gather(
+        *[adapter.get_prices(part_numbers, vin=vin, job_description=job_description) for adapter in adapters],
+        return_exceptions=True
+    )
+    
+    results: List[VendorPriceResult] = []
+    errors: List[BaseException] = []
+    for adapter, outcome in zip(adapters, outcomes):
+        # A vendor call cancelled on its own comes back as a CancelledError
+        # value and counts as a failure; if we are being cancelled, stop here
+        if isinstance(outcome, asyncio.CancelledError) and asyncio.current_task().cancelling():
+            raise outcome
+        if isinstance(outcome, BaseException):
+            logger.error(f"VENDOR: {type(adapter).__name__} failed: {outcome!r}")
+            errors.append(outcome)
+        else:
+            results.extend(outcome)
+    
+    if errors and len(errors) == len(adapters):
+        raise errors[0]
+    return results
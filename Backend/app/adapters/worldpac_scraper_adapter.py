@@ -9,14 +9,48 @@ This is part of the Hybrid Approach:
 
 import logging
 import asyncio
-from typing import List
+import re
+from typing import AsyncIterator, List, Optional, Tuple
 from decimal import Decimal
 import random
+from urllib.parse import quote_plus
+from playwright.async_api import Browser, Error as PlaywrightError, Page, TimeoutError as PlaywrightTimeoutError
 from app.adapters.vendor_adapter_interface import VendorAdapterInterface, VendorPriceResult
 from app.core.config import settings
+from app.utils import price_cache
+from app.utils.scraper_utils import (
+    get_or_create_browser,
+    new_stealth_page,
+    load_auth_state,
+    save_auth_state,
+    human_delay,
+    human_type,
+    safe_navigate,
+    take_debug_screenshot,
+    check_session_status,
+    read_visible_texts
+)
 
 logger = logging.getLogger(__name__)
 
+# Candidate selectors are joined into one CSS union so Playwright resolves the
+# first visible match in a single browser-side query instead of one probe per
+# candidate. *_CSS are plain CSS for reads inside the page.
+USERNAME_SELECTOR = "#username, input[name='username'], #email >> visible=true"
+PASSWORD_SELECTOR = "#password, input[name='password'], input[type='password'] >> visible=true"
+LOGIN_BUTTON_SELECTOR = "#login-button, button[type='submit'], .login-btn, input[type='submit'] >> visible=true"
+DASHBOARD_SELECTOR = ".dashboard, .home, #main-content"
+SEARCH_SELECTOR = "#part-search-input, #search, input[name='search'], input[placeholder*='part'], input[placeholder*='search'] >> visible=true"
+PRICE_CSS = ".price, .product-price, .item-price, [data-price], .cost, .amount"
+PRICE_SELECTOR = f"{PRICE_CSS} >> visible=true"
+BRAND_CSS = ".brand, .manufacturer, .product-brand"
+
+# The Worldpac browser outlives each call; one call at a time drives its login page
+_session_lock = asyncio.Lock()
+
+# Number in a price cell like "$1,234.56" (commas are stripped before matching)
+PRICE_PATTERN = re.compile(r'[\d,]+\.?\d*')
+
 
 class WorldpacScraperAdapter(VendorAdapterInterface):
     """
@@ -24,35 +58,97 @@ class WorldpacScraperAdapter(VendorAdapterInterface):
     Scrapes pricing for specific part numbers with anti-detection.
     """
 
-    async def get_prices(self, part_numbers: List[str]) -> List[VendorPriceResult]:
+    async def get_prices(
+        self,
+        part_numbers: List[str],
+        vin: Optional[str] = None,
+        job_description: Optional[str] = None
+    ) -> List[VendorPriceResult]:
+        return [result async for result in self.stream_prices(part_numbers, vin=vin, job_description=job_description)]
+
+    async def stream_prices(
+        self,
+        part_numbers: List[str],
+        vin: Optional[str] = None,
+        job_description: Optional[str] = None
+    ) -> AsyncIterator[VendorPriceResult]:
+        # Serve recently scraped parts from the price cache; only scrape the rest
+        hits = await asyncio.gather(*[price_cache.get("worldpac", part_num) for part_num in part_numbers])
+        cached = [hit for hit in hits if hit is not None]
+        to_scrape = [part_num for part_num, hit in zip(part_numbers, hits) if hit is None]
+        
+        if cached:
+            logger.info(f"WORLDPAC SCRAPER: {len(cached)} price(s) served from cache")
+        for result in cached:
+            yield result
+        
+        if to_scrape:
+            async for result in self._stream_scraped_prices(to_scrape):
+                yield result
+
+    async def _stream_scraped_prices(self, part_numbers: List[str]) -> AsyncIterator[VendorPriceResult]:
+        """Scrape parts in parallel contexts, yielding each part's offers as it finishes."""
         logger.info(f"WORLDPAC SCRAPER: Getting prices for {part_numbers}")
         
+        session = await self._open_session()
+        if session is None:
+            for result in await self._get_fallback_data(part_numbers):
+                yield result
+            return
+        browser, storage_state, search_url = session
+        
+        # Part searches run in parallel browser contexts, at most
+        # SCRAPE_CONCURRENCY at once to bound Chromium memory
+        semaphore = asyncio.Semaphore(settings.SCRAPE_CONCURRENCY or 4)
+        
+        async def scrape_part(part_num: str) -> List[VendorPriceResult]:
+            async with semaphore:
+                try:
+                    part_context, part_page = await new_stealth_page(browser, storage_state)
+                    try:
+                        direct_url = self._search_url(part_num)
+                        if not await safe_navigate(part_page, direct_url or search_url):
+                            raise Exception("Failed to navigate to Worldpac")
+                        return await self._scrape_part(part_page, part_num, submitted=direct_url is not None)
+                    finally:
+                        await part_context.close()
+                except Exception as e:
+                    # Handled per part so one failure doesn't end the stream
+                    logger.error(f"WORLDPAC: Error searching {part_num}: {e}")
+                    return await self._get_fallback_data([part_num])
+        
+        # Results stream out in completion order; closing the stream early
+        # cancels the scrapes still running and waits for their contexts to close
+        tasks = [asyncio.create_task(scrape_part(part_num)) for part_num in part_numbers]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for result in await next_done:
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _open_session(self) -> Optional[Tuple[Browser, dict, str]]:
+        """
+        Log the shared browser in and return (browser, storage_state,
+        search_url) for seeding per-part contexts, or None to fall back.
+        """
         # Check credentials
         if not settings.WORLDPAC_USERNAME or not settings.WORLDPAC_PASSWORD:
             logger.warning("WORLDPAC SCRAPER: Missing credentials! Using fallback data.")
-            return await self._get_fallback_data(part_numbers)
+            return None
         
         try:
-            from app.utils.scraper_utils import (
-                get_stealth_browser, 
-                human_delay, 
-                human_type,
-                safe_navigate,
-                safe_fill,
-                safe_click,
-                take_debug_screenshot,
-                check_session_status
-            )
-            
-            browser, context, page = await get_stealth_browser()
+            # Reuse the running Worldpac browser; a fresh launch starts from the
+            # last saved login so check_session_status can skip the form
+            browser, context, page = await get_or_create_browser("worldpac", storage_state=load_auth_state("worldpac"))
             
             if not browser:
                 logger.error("WORLDPAC: Could not launch stealth browser")
-                return await self._get_fallback_data(part_numbers)
+                return None
             
-            try:
-                results = []
-                
+            async with _session_lock:
                 # Navigate to Worldpac
                 if not await safe_navigate(page, "https://speeddial.worldpac.com/login"):
                     raise Exception("Failed to navigate to Worldpac")
@@ -67,205 +163,158 @@ class WorldpacScraperAdapter(VendorAdapterInterface):
                     logger.info("WORLDPAC: Attempting login...")
                     
                     # Fill login form with human-like typing
-                    username_selectors = ["#username", "input[name='username']", "#email"]
-                    password_selectors = ["#password", "input[name='password']", "input[type='password']"]
-                    
-                    # Try different selectors for username
                     logged_in = False
-                    for user_sel in username_selectors:
-                        try:
-                            if await page.is_visible(user_sel):
-                                await human_type(page, user_sel, settings.WORLDPAC_USERNAME)
-                                break
-                        except:
-                            continue
+                    if await page.locator(USERNAME_SELECTOR).count():
+                        await human_type(page, USERNAME_SELECTOR, settings.WORLDPAC_USERNAME)
                     
-                    # Try different selectors for password
-                    for pass_sel in password_selectors:
-                        try:
-                            if await page.is_visible(pass_sel):
-                                await human_type(page, pass_sel, settings.WORLDPAC_PASSWORD)
-                                break
-                        except:
-                            continue
+                    if await page.locator(PASSWORD_SELECTOR).count():
+                        await human_type(page, PASSWORD_SELECTOR, settings.WORLDPAC_PASSWORD)
                     
                     await human_delay(500, 1000)
                     
                     # Click login button
-                    login_selectors = [
-                        "#login-button", 
-                        "button[type='submit']", 
-                        ".login-btn",
-                        "input[type='submit']"
-                    ]
                     
-                    for btn_sel in login_selectors:
-                        try:
-                            if await page.is_visible(btn_sel):
-                                await page.click(btn_sel)
-                                logged_in = True
-                                break
-                        except:
-                            continue
+                    login_button = page.locator(LOGIN_BUTTON_SELECTOR).first
+                    if await login_button.count():
+                        await login_button.click()
+                        logged_in = True
                     
                     if logged_in:
                         # Wait for dashboard
                         try:
-                            await page.wait_for_selector(".dashboard, .home, #main-content", timeout=30000)
+                            await page.wait_for_selector(DASHBOARD_SELECTOR, timeout=30000)
                             logger.info("WORLDPAC: Login successful!")
-                        except:
+                            await save_auth_state("worldpac", context)
+                        except PlaywrightError:
                             await take_debug_screenshot(page, "worldpac_login_fail")
                             logger.error("WORLDPAC: Login may have failed - continuing anyway")
                 
-                # Now search for parts
-                for part_num in part_numbers:
-                    try:
-                        logger.info(f"WORLDPAC: Searching for part {part_num}")
-                        
-                        # Find and fill search box
-                        search_selectors = [
-                            "#part-search-input",
-                            "#search",
-                            "input[name='search']",
-                            "input[placeholder*='part']",
-                            "input[placeholder*='search']"
-                        ]
-                        
-                        search_filled = False
-                        for search_sel in search_selectors:
-                            try:
-                                if await page.is_visible(search_sel):
-                                    await page.fill(search_sel, "")  # Clear first
-                                    await human_delay(200, 400)
-                                    await human_type(page, search_sel, part_num)
-                                    search_filled = True
-                                    break
-                            except:
-                                continue
-                        
-                        if not search_filled:
-                            logger.warning(f"WORLDPAC: Could not find search box for {part_num}")
-                            continue
-                        
-                        # Submit search
-                        await human_delay(300, 600)
-                        await page.keyboard.press("Enter")
-                        
-                        # Wait for results
-                        await human_delay(2000, 4000)
-                        
-                        # Try to scrape price (multiple possible selectors)
-                        price = None
-                        price_selectors = [
-                            ".price", ".product-price", ".item-price",
-                            "[data-price]", ".cost", ".amount"
-                        ]
-                        
-                        for price_sel in price_selectors:
-                            try:
-                                if await page.is_visible(price_sel):
-                                    price_text = await page.inner_text(price_sel)
-                                    # Extract number from text like "$123.45"
-                                    import re
-                                    price_match = re.search(r'[\d,]+\.?\d*', price_text.replace(',', ''))
-                                    if price_match:
-                                        price = Decimal(price_match.group())
-                                        break
-                            except:
-                                continue
-                        
-                        # Try to get brand
-                        brand = "Unknown"
-                        brand_selectors = [".brand", ".manufacturer", ".product-brand"]
-                        for brand_sel in brand_selectors:
-                            try:
-                                if await page.is_visible(brand_sel):
-                                    brand = await page.inner_text(brand_sel)
-                                    break
-                            except:
-                                continue
-                        
-                        # Create result
-                        if price:
-                            results.append(VendorPriceResult(
-                                vendor_id=f"worldpac_{random.randint(1000, 9999)}",
-                                vendor_name="Worldpac",
-                                brand=brand[:50] if brand else "Aftermarket",
-                                part_number=part_num,
-                                price=price,
-                                stock_status="Live Scraped",
-                                stock_quantity=1,
-                                warehouse_location="Check Worldpac",
-                                warehouse_distance_miles=0,
-                                delivery_option="See Website",
-                                warranty="Manufacturer"
-                            ))
-                            logger.info(f"WORLDPAC: Found price ${price} for {part_num}")
-                        else:
-                            logger.warning(f"WORLDPAC: No price found for {part_num}")
-                            # Add fallback for this part
-                            fallback = await self._get_fallback_data([part_num])
-                            results.extend(fallback)
-                        
-                    except Exception as part_err:
-                        logger.error(f"WORLDPAC: Error searching {part_num}: {part_err}")
-                        fallback = await self._get_fallback_data([part_num])
-                        results.extend(fallback)
-                
-                return results if results else await self._get_fallback_data(part_numbers)
-                
-            finally:
-                # Close browser
-                try:
-                    await browser.close()
-                except:
-                    pass
+                # Each part gets its own context, seeded with the logged-in
+                # session so it skips auth, and runs alongside the others
+                return browser, await context.storage_state(), page.url
                     
         except ImportError as ie:
             logger.error(f"WORLDPAC: Missing dependency: {ie}")
-            return await self._get_fallback_data(part_numbers)
+            return None
         except Exception as e:
             logger.error(f"WORLDPAC SCRAPER ERROR: {e}")
-            return await self._get_fallback_data(part_numbers)
+            return None
+
+    def _search_url(self, part_num: str) -> Optional[str]:
+        """Direct results URL for a part, or None to use the search box."""
+        if not settings.WORLDPAC_SEARCH_URL:
+            return None
+        return settings.WORLDPAC_SEARCH_URL.replace("{part}", quote_plus(part_num))
+
+    async def _scrape_part(self, page: Page, part_num: str, submitted: bool = False) -> List[VendorPriceResult]:
+        """Search one part number on a logged-in Worldpac page and scrape its offer.
+        
+        `submitted` means the page is already on this part's results (direct
+        search URL), so the search box is skipped.
+        """
+        logger.info(f"WORLDPAC: Searching for part {part_num}")
+        
+        if not submitted:
+            # Find and fill search box
+            search_box = page.locator(SEARCH_SELECTOR).first
+        
+            try:
+                await search_box.wait_for(state="visible", timeout=3000)
+            except PlaywrightTimeoutError:
+                logger.warning(f"WORLDPAC: Could not find search box for {part_num}")
+                return []
+        
+            # Select-all and type over it: one call each to clear and to type,
+            # with the per-keystroke cadence kept in the browser
+            await search_box.click()
+            await search_box.press("Control+A")
+            await search_box.press_sequentially(part_num, delay=random.randint(40, 90) if settings.SCRAPER_STEALTH else 0)
+        
+            # Submit search
+            await human_delay(300, 600)
+            await page.keyboard.press("Enter")
+        
+        # Wait for results to render instead of a fixed pause, then a short
+        # jitter to keep a human cadence
+        try:
+            await page.locator(PRICE_SELECTOR).first.wait_for(timeout=5000)
+        except PlaywrightTimeoutError:
+            await take_debug_screenshot(page, f"worldpac_no_price_{part_num}")
+        await human_delay(200, 500)
+        
+        # Price and brand cells in one round-trip
+        try:
+            cells = await read_visible_texts(page, {
+                "price": PRICE_CSS,
+                "brand": BRAND_CSS,
+            })
+        except PlaywrightError:
+            cells = {}
+        
+        price = None
+        if cells.get("price"):
+            # Extract number from text like "$123.45"
+            price_match = PRICE_PATTERN.search(cells["price"].replace(',', ''))
+            if price_match:
+                price = Decimal(price_match.group())
+        
+        brand = cells.get("brand")
+        if brand is None:
+            brand = "Unknown"
+        
+        # Create result
+        if price:
+            logger.info(f"WORLDPAC: Found price ${price} for {part_num}")
+            result = VendorPriceResult(
+                vendor_id=f"worldpac_{random.randint(1000, 9999)}",
+                vendor_name="Worldpac",
+                brand=brand[:50] if brand else "Aftermarket",
+                part_number=part_num,
+                price=price,
+                stock_status="Live Scraped",
+                stock_quantity=1,
+                warehouse_location="Check Worldpac",
+                warehouse_distance_miles=0,
+                delivery_option="See Website",
+                warranty="Manufacturer"
+            )
+            await price_cache.set("worldpac", part_num, result)
+            return [result]
+        
+        logger.warning(f"WORLDPAC: No price found for {part_num}")
+        # Add fallback for this part
+        return await self._get_fallback_data([part_num])
 
     async def _get_fallback_data(self, part_numbers: List[str]) -> List[VendorPriceResult]:
         """
         Return fallback data when scraping fails.
         Data is marked as requiring manual verification.
         """
-        await asyncio.sleep(1)  # Small delay to simulate processing
-        results = []
+        # Draw all ids and prices in one call each instead of per row
+        ids = random.choices(range(100, 1000), k=2 * len(part_numbers))
+        prices = random.choices(range(50, 151), k=len(part_numbers))
         
-        for part in part_numbers:
-            base_price = Decimal(random.randint(50, 150))
-            results.append(VendorPriceResult(
-                vendor_id=f"wp_fallback_{random.randint(100, 999)}",
-                vendor_name="Worldpac",
-                brand="TBD - Manual Check Required",
-                part_number=part,
-                price=base_price,
-                stock_status="⚠️ REQUIRES MANUAL VERIFICATION",
-                stock_quantity=0,
-                warehouse_location="Unknown - Check Worldpac.com",
-                warehouse_distance_miles=0,
-                delivery_option="Manual Check Required",
-                warranty="Unknown"
-            ))
-            
-            # Add economy option
-            results.append(VendorPriceResult(
-                vendor_id=f"wp_fallback_{random.randint(100, 999)}_eco",
+        # A standard and an economy option per part
+        results = [
+            VendorPriceResult(
+                vendor_id=vendor_id,
                 vendor_name="Worldpac",
-                brand="Economy - Manual Check Required",
+                brand=brand,
                 part_number=part,
-                price=base_price * Decimal("0.7"),
+                price=price,
                 stock_status="⚠️ REQUIRES MANUAL VERIFICATION",
                 stock_quantity=0,
                 warehouse_location="Unknown - Check Worldpac.com",
                 warehouse_distance_miles=0,
                 delivery_option="Manual Check Required",
                 warranty="Unknown"
-            ))
+            )
+            for part, base_price, standard_id, economy_id in zip(part_numbers, prices, ids[::2], ids[1::2])
+            for vendor_id, brand, price in (
+                (f"wp_fallback_{standard_id}", "TBD - Manual Check Required", Decimal(base_price)),
+                (f"wp_fallback_{economy_id}_eco", "Economy - Manual Check Required", Decimal(base_price) * Decimal("0.7")),
+            )
+        ]
         
         logger.warning(f"WORLDPAC: Returned fallback data for {len(part_numbers)} parts - MANUAL VERIFICATION NEEDED")
         return results
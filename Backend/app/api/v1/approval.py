@@ -4,11 +4,12 @@ Customer Approval Portal API Routes
 Public endpoints for customer approval workflow.
 No authentication required - accessed via unique token.
 """
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 from pydantic import BaseModel, Field
 from typing import Optional
 
 from app.services.approval_service import approval_service
+from app.utils.http_cache import not_modified, weak_etag
 
 router = APIRouter()
 
@@ -40,19 +41,12 @@ async def generate_approval_link(request: GenerateApprovalLinkRequest):
     - Email template
     - Expiration date
     """
-    try:
-        result = approval_service.generate_approval_link(
-            estimate_id=request.estimate_id,
-            estimate_data=request.estimate_data
-        )
-        
-        return result
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate approval link: {str(e)}"
-        )
+    result = approval_service.generate_approval_link(
+        estimate_id=request.estimate_id,
+        estimate_data=request.estimate_data
+    )
+    
+    return result
 
 
 @router.get(
@@ -60,12 +54,13 @@ async def generate_approval_link(request: GenerateApprovalLinkRequest):
     summary="View estimate by token",
     description="Customer-facing: View estimate details via approval token"
 )
-async def view_estimate(token: str):
+async def view_estimate(token: str, request: Request, response: Response):
     """
     View estimate by approval token.
     
     This is the public endpoint customers access
-    when clicking the approval link.
+    when clicking the approval link. Refreshes with If-None-Match get a
+    304 until the customer acts on the estimate.
     """
     result = approval_service.get_estimate_by_token(token)
     
@@ -81,6 +76,11 @@ async def view_estimate(token: str):
             detail=result.get("error", "Link has expired")
         )
     
+    # The estimate snapshot behind a token never changes; only its status does
+    cached = not_modified(request, response, weak_etag(token, result["status"]))
+    if cached:
+        return cached
+    
     return result
 
 
@@ -6,14 +6,16 @@ Now includes: recall check, warranty check, vendor scoring, part conditions, cle
 """
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr, field_validator
 from typing import Optional, Dict
 from decimal import Decimal
 
 
 from app.services.auto_generate_service import auto_generate_service
-import traceback
-import os
+from app.services.vin_decoder_service import normalize_vin
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -38,8 +40,8 @@ class AutoGenerateRequest(BaseModel):
     taxRate: Optional[Decimal] = Field(Decimal("0.0925"), ge=0, le=1, description="Tax rate")
     vendorWeights: Optional[VendorWeightsRequest] = Field(None, description="Vendor scoring weights")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "vin": "1HGBH41JXMN109186",
                 "serviceRequest": "Brake pads replacement",
@@ -57,6 +59,12 @@ class AutoGenerateRequest(BaseModel):
                 }
             }
         }
+    )
+    
+    @field_validator("vin")
+    @classmethod
+    def _check_vin(cls, v: str) -> str:
+        return normalize_vin(v)
 
 
 @router.post(
@@ -96,6 +104,8 @@ async def auto_generate_estimate(
     - Vendor comparison with scores
     - Confidence score and recommended action
     """
+    # Step failures (VIN decode, scrapers, vendors...) are reported inside the
+    # result; only an unexpected error escapes generate_estimate
     try:
         # Prepare vendor weights
         vendor_weights = None
@@ -122,14 +132,9 @@ async def auto_generate_estimate(
         
         return result
         
-    except Exception as e:
-        # Debug logging
-        with open("error_log.txt", "w") as f:
-            f.write(str(e))
-            f.write("\n")
-            f.write(traceback.format_exc())
-            
+    except Exception:
+        logger.exception("Auto-generation failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Auto-generation failed: {str(e)}"
+            detail="Auto-generation failed"
         )
@@ -1,13 +1,17 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from typing import List
 from app.models.customer import Customer
 
 router = APIRouter()
 
 @router.get("/", response_model=List[Customer])
-async def get_customers():
+async def get_customers(
+    skip: int = Query(0, ge=0, description="Number of customers to skip"),
+    limit: int = Query(50, ge=1, le=500, description="Maximum customers to return")
+):
     """
-    Get all customers.
+    Get customers, one page at a time.
     """
-    customers = await Customer.find_all().to_list()
+    # Ordered by _id (default index) so pages are stable between requests
+    customers = await Customer.find_all().sort("+_id").skip(skip).limit(limit).to_list()
     return customers
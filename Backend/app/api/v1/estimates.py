@@ -5,10 +5,13 @@ Endpoints for estimate operations:
 - POST /calculate - Real-time calculation (no save)
 - POST /draft - Create draft estimate
 - GET /{estimate_id} - Get estimate by ID
-- GET / - List advisor's estimates
+- GET / - List advisor's estimates (?format=ndjson to stream)
 - POST /{estimate_id}/send - Send estimate to customer
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import hashlib
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from typing import Optional, List
 
 from app.core.dependencies import get_current_active_advisor
@@ -20,6 +23,7 @@ from app.schemas.estimate import (
     EstimateResponseSchema
 )
 from app.services.estimate_service import get_estimate_service
+from app.utils.http_cache import not_modified, weak_etag
 
 router = APIRouter()
 
@@ -90,11 +94,15 @@ async def update_draft_estimate(
     description="Retrieve a specific estimate by ID with all details."
 )
 async def get_estimate(
-    estimate_id: str
+    estimate_id: str,
+    request: Request,
+    response: Response
 ):
     """
     Get estimate by ID.
     Authorization: Only the advisor who created the estimate can view it.
+    
+    Supports If-None-Match: an unchanged estimate returns 304 with no body.
     """
     service = get_estimate_service()
     estimate = await service.get_estimate(estimate_id)
@@ -105,6 +113,16 @@ async def get_estimate(
             detail=f"Estimate with ID {estimate_id} not found"
         )
     
+    # Hash the whole payload: the linked vehicle and customer are updated
+    # separately from the estimate and don't bump its updatedAt
+    etag = weak_etag(
+        estimate.estimateId,
+        hashlib.blake2b(estimate.model_dump_json().encode(), digest_size=12).hexdigest()
+    )
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
+    
     return estimate
 
 
@@ -115,13 +133,26 @@ async def get_estimate(
     description="Get all estimates created by the current advisor with optional status filter."
 )
 async def list_estimates(
-    status_filter: Optional[str] = Query(None, description="Filter by status: draft, sent, approved, declined")
+    status_filter: Optional[str] = Query(None, description="Filter by status: draft, sent, approved, declined"),
+    response_format: str = Query(
+        "json",
+        alias="format",
+        pattern="^(json|ndjson)$",
+        description="json: one array; ndjson: one estimate per line, streamed as read"
+    )
 ):
     """
     List all estimates for the current advisor.
     """
     service = get_estimate_service()
-    print("Listing estimates for system advisor")
+    
+    if response_format == "ndjson":
+        estimates = service.stream_advisor_estimates("system", status_filter)
+        return StreamingResponse(
+            (est.model_dump_json().encode() + b"\n" async for est in estimates),
+            media_type="application/x-ndjson"
+        )
+    
     return await service.get_advisor_estimates("system", status_filter)
 
 
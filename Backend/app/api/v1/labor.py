@@ -5,8 +5,9 @@ Endpoints for labor time lookup:
 - POST /lookup - Get labor time for a job
 """
 from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from app.services.labor_service import labor_service
+from app.services.vin_decoder_service import normalize_vin
 from app.adapters.labor_adapter_interface import LaborTimeResult
 
 router = APIRouter()
@@ -17,13 +18,19 @@ class LaborLookupRequest(BaseModel):
     vin: str = Field(..., min_length=17, max_length=17, description="Vehicle VIN")
     jobDescription: str = Field(..., min_length=1, description="Job description")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "vin": "1HGBH41JXMN109186",
                 "jobDescription": "Brake Pad Replacement"
             }
         }
+    )
+    
+    @field_validator("vin")
+    @classmethod
+    def _check_vin(cls, v: str) -> str:
+        return normalize_vin(v)
 
 
 @router.post(
@@ -5,9 +5,10 @@ Endpoints for parts lookup:
 - POST /search - Search for parts
 """
 from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import List
 from app.services.parts_service import parts_service
+from app.services.vin_decoder_service import normalize_vin
 from app.adapters.parts_adapter_interface import PartResult
 
 router = APIRouter()
@@ -18,13 +19,19 @@ class PartsSearchRequest(BaseModel):
     vin: str = Field(..., min_length=17, max_length=17, description="Vehicle VIN")
     jobDescription: str = Field(..., min_length=1, description="Job description")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "vin": "1HGBH41JXMN109186",
                 "jobDescription": "Brake Pad Replacement"
             }
         }
+    )
+    
+    @field_validator("vin")
+    @classmethod
+    def _check_vin(cls, v: str) -> str:
+        return normalize_vin(v)
 
 
 @router.post(
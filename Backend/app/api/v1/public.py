@@ -5,16 +5,24 @@ These endpoints are accessible via public tokens for customer portal access.
 """
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
+from typing import Literal
 
+from app.models.estimate import EstimateStatus
 from app.schemas.estimate import EstimateResponseSchema
 from app.services.estimate_service import get_estimate_service
 
 router = APIRouter()
 
+# Portal actions and the status each one sets
+_ACTION_TO_STATUS = {
+    "approve": EstimateStatus.APPROVED,
+    "decline": EstimateStatus.DECLINED,
+}
+
 
 class CustomerResponseSchema(BaseModel):
     """Customer response to estimate"""
-    action: str  # "approve" or "decline"
+    action: Literal["approve", "decline"]
     customerNotes: str = ""
 
 
@@ -60,32 +68,17 @@ async def respond_to_estimate(
     - approve: Updates status to 'approved'
     - decline: Updates status to 'declined'
     """
+    # action is validated by CustomerResponseSchema (422 otherwise)
+    new_status = _ACTION_TO_STATUS[response.action]
     service = get_estimate_service()
-    estimate = await service.get_estimate_by_token(token)
     
-    if not estimate:
+    # One conditional update by token; no need to load the estimate first
+    if not await service.respond_by_token(token, new_status):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Estimate not found or has expired"
         )
     
-    # Validate action
-    if response.action not in ["approve", "decline"]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Action must be 'approve' or 'decline'"
-        )
-    
-    # Update status based on action
-    from app.models.estimate import EstimateStatus
-    from app.repositories.estimate_repository import EstimateRepository
-    
-    repository = EstimateRepository()
-    new_status = EstimateStatus.APPROVED if response.action == "approve" else EstimateStatus.DECLINED
-    
-    # Use estimateId from the retrieved estimate
-    await repository.update_status(estimate.estimateId, new_status)
-    
     # TODO: Send notification to advisor
     # notification_service.notify_advisor(estimate.advisorId, response)
     
@@ -3,12 +3,17 @@ Vehicles API Routes
 
 Endpoints for vehicle-related operations:
 - GET /decode/{vin} - Decode VIN using NHTSA API
+- DELETE /decode/{vin}/cache - Forget a cached decode
 """
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
 from app.services.vin_decoder_service import vin_decoder_service, VehicleDecodeResult
 
 router = APIRouter()
 
+# A VIN always decodes to the same vehicle, so clients may reuse a decode for
+# as long as the server keeps it cached
+DECODE_CACHE_CONTROL = "public, max-age=86400"
+
 
 @router.get(
     "/decode/{vin}",
@@ -16,7 +21,7 @@ router = APIRouter()
     summary="Decode VIN",
     description="Decode Vehicle Identification Number using NHTSA free API to get vehicle details."
 )
-async def decode_vin(vin: str):
+async def decode_vin(vin: str, response: Response):
     """
     Decode VIN using NHTSA API.
     
@@ -36,14 +41,38 @@ async def decode_vin(vin: str):
     """
     try:
         result = await vin_decoder_service.decode_vin(vin)
+        if result.make or result.year:
+            response.headers["Cache-Control"] = DECODE_CACHE_CONTROL
         return result
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except LookupError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to decode VIN: {str(e)}"
         )
+
+
+@router.delete(
+    "/decode/{vin}/cache",
+    summary="Forget cached VIN decode",
+    description="Drop a VIN from the decode cache so the next decode fetches fresh data from NHTSA."
+)
+async def forget_vin_decode(vin: str):
+    """Clear one VIN from the decode cache (e.g. after NHTSA corrects its data)."""
+    try:
+        removed = vin_decoder_service.forget(vin)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return {"vin": vin.upper(), "removed": removed}
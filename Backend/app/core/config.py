@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Literal
 
@@ -15,6 +16,10 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    # Motor connection pool, per uvicorn worker process
+    # (total connections = workers * MONGO_MAX_POOL_SIZE)
+    MONGO_MAX_POOL_SIZE: int = 30
+    MONGO_MIN_POOL_SIZE: int = 5
     
     # JWT Authentication
     SECRET_KEY: str
@@ -36,9 +41,18 @@ class Settings(BaseSettings):
     
     SSF_USERNAME: str = ""
     SSF_PASSWORD: str = ""
+    # Optional direct search-results URLs with a {part} placeholder, e.g.
+    # https://shop.ssfautoparts.com/search?q={part}. When set, each part is a
+    # single navigation instead of filling the search box and pressing Enter.
+    WORLDPAC_SEARCH_URL: str = ""
+    SSF_SEARCH_URL: str = ""
     
     ALLDATA_USERNAME: str = ""
     ALLDATA_PASSWORD: str = ""
+    # Optional JSON endpoint the ALLDATA UI calls for labor times (copy it from
+    # the DevTools Network tab). When set, lookups try it with the browser
+    # session's cookies before driving the page.
+    ALLDATA_LABOR_API_URL: str = ""
     
     PARTSLINK24_COMPANY_ID: str = ""
     PARTSLINK24_USERNAME: str = ""
@@ -67,10 +81,26 @@ class Settings(BaseSettings):
     SCRAPER_SERVICE_URL: str = "http://localhost:5000"
     SCRAPER_API_KEY: str = "estimaro_scraper_secret_2024"
     
+    # Human-like random pauses between scraper actions (anti-bot pacing).
+    # Disable for dev runs or CDP sessions that don't need it.
+    SCRAPER_STEALTH: bool = True
+
+    # Max parallel browser contexts per vendor scrape (~30-80MB each)
+    SCRAPE_CONCURRENCY: int = 4
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the one Settings instance (.env is parsed once per process).
+    Usable as a FastAPI dependency: Depends(get_settings).
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -12,7 +12,23 @@ async def init_db():
     """
     Initialize MongoDB connection and Beanie ODM.
     """
-    client = AsyncIOMotorClient(settings.DATABASE_URL)
+    client = AsyncIOMotorClient(
+        settings.DATABASE_URL,
+        maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+        # Keep a few connections warm so bursts don't pay for new handshakes
+        minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+        # Recycle connections idle for 5 min (load balancers drop them silently)
+        maxIdleTimeMS=300_000,
+        # Fail a request after 30s waiting for a free connection instead of
+        # queueing forever when the pool is exhausted
+        waitQueueTimeoutMS=30_000,
+        # Compress wire traffic (estimates carry their items embedded); the
+        # server picks the first one it supports, zlib needs no extra package
+        compressors="zstd,zlib",
+        # Surface an unreachable cluster in 10s rather than the 30s default,
+        # still long enough to ride out a replica set election
+        serverSelectionTimeoutMS=10_000,
+    )
     
     # Selecting the database name from the URL or default
     db_name = client.get_default_database().name
@@ -35,11 +51,3 @@ async def init_db():
             Estimate
         ]
     )
-
-# Simplified dependency for backward compatibility during migration
-# In purely async Beanie, we don't strictly need a session dependency like SQLAlchemy
-# but we might need to mock it or remove it from routes.
-def get_db():
-    """Deprecated: No-op for MongoDB migration"""
-    yield None
-
@@ -8,15 +8,27 @@ if sys.platform == 'win32':
     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
 import logging
-import traceback
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from app.core.config import settings
 
-# Setup Logging
-logging.basicConfig(level=logging.INFO)
+# Setup Logging. Records are formatted by the QueueHandler and written to
+# stderr by a listener thread, so request handlers never block the event
+# loop on log I/O.
+_log_queue = queue.SimpleQueue()
+_log_stream = logging.StreamHandler()
+# Unhandled request errors are also appended to error_log.txt
+_error_file = logging.FileHandler("error_log.txt", delay=True)
+_error_file.addFilter(lambda record: record.name == "app.unhandled")
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
+_log_listener = QueueListener(_log_queue, _log_stream, _error_file)
+_log_listener.start()
 logger = logging.getLogger(__name__)
+error_logger = logging.getLogger("app.unhandled")
 
 # Create FastAPI application
 app = FastAPI(
@@ -25,8 +37,18 @@ app = FastAPI(
     description="Professional Auto Repair Estimation System",
     docs_url="/docs",
     redoc_url="/redoc",
+    # orjson encodes the large nested estimate payloads several times faster
+    # than the stdlib json module
+    default_response_class=ORJSONResponse,
 )
 
+# --------------------------------------------------------------------------
+# Response compression. Auto-generate and estimate payloads run to tens of KB;
+# small bodies (e.g. /estimates/calculate) stay under the threshold.
+# Added before CORS so CORS remains the outermost middleware.
+# --------------------------------------------------------------------------
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # --------------------------------------------------------------------------
 # CORS Middleware (Sabse pehle load hona chahiye)
 # --------------------------------------------------------------------------
@@ -49,6 +71,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browsers reuse a preflight for an hour (default 10 min); the
+    # dashboard's JSON POSTs otherwise pay an extra OPTIONS round trip
+    max_age=3600,
 )
 
 # --------------------------------------------------------------------------
@@ -67,29 +92,32 @@ async def on_startup():
         # Error log print karein taaki terminal me dikhe
         print(f"CRITICAL DATABASE ERROR: {e}")
 
+@app.on_event("shutdown")
+async def on_shutdown():
+    # Disconnect scrapers from the shared Chrome session (Chrome keeps running),
+    # close the vendor stealth browsers and the pooled HTTP client
+    from app.utils.scraper_utils import close_cdp_session, close_stealth_browsers
+    from app.utils.http_client import close_http_client
+    await close_cdp_session()
+    await close_stealth_browsers()
+    await close_http_client()
+    # Last, so the shutdown messages above still get written
+    _log_listener.stop()
+
 # --------------------------------------------------------------------------
 # Global Exception Handler (Taaki 500 error pe bhi JSON response mile)
 # --------------------------------------------------------------------------
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    error_msg = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
-    
-    # Terminal mein error print karein
-    print(f"ERROR OCCURRED AT {request.url.path}:")
-    print(error_msg)
+    # Terminal and error_log.txt; both are written by the log listener thread.
+    # The client only gets a generic message - the traceback stays in the log.
+    error_logger.error(f"--- Error at {request.url} ---", exc_info=exc)
     
-    try:
-        with open("error_log.txt", "a") as f:
-            f.write(f"\n--- Error at {request.url} ---\n")
-            f.write(error_msg)
-    except Exception:
-        pass
-        
     return JSONResponse(
         status_code=500,
         content={
             "message": "Internal Server Error",
-            "detail": str(exc),
+            "detail": "An unexpected error occurred",
             "path": str(request.url)
         }
     )
@@ -1,6 +1,6 @@
 """
 Database models package.
-Import all models here for Alembic auto-detection.
+Import all models here so init_beanie can register them.
 """
 from app.models.user import User, UserRole
 from app.models.customer import Customer
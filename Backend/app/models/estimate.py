@@ -1,10 +1,11 @@
 from beanie import Document, Indexed
+from pymongo import ASCENDING, DESCENDING, IndexModel
 from pydantic import Field, BeforeValidator
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import List, Optional, Annotated, Any
 import enum
-import uuid
+import secrets
 from app.models.estimate_item import EstimateItem
 
 def coerce_float(v: Any) -> float:
@@ -41,7 +42,9 @@ class Estimate(Document):
     total: Annotated[float, BeforeValidator(coerce_float)] = 0.0
     
     # Customer portal access
-    public_token: str = Indexed(unique=True, default_factory=lambda: str(uuid.uuid4()))
+    # 128 random bits, URL-safe base64 (22 chars). Older estimates keep their
+    # 36-char UUID tokens; lookups are plain string matches, so both work.
+    public_token: Annotated[str, Indexed(unique=True)] = Field(default_factory=lambda: secrets.token_urlsafe(16))
     
     # Timestamps
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -61,6 +64,12 @@ class Estimate(Document):
     class Settings:
         name = "estimates"
         use_state_management = True
+        # Estimate lists are newest first, optionally per advisor or status
+        indexes = [
+            IndexModel([("created_at", DESCENDING)]),
+            IndexModel([("advisor_id", ASCENDING), ("created_at", DESCENDING)]),
+            IndexModel([("status", ASCENDING), ("created_at", DESCENDING)]),
+        ]
     
     @property
     def is_expired(self):
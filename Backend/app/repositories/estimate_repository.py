@@ -1,8 +1,10 @@
-from typing import Optional, List, Dict
+from typing import AsyncIterator, Optional, List, Dict
 from decimal import Decimal
 import uuid
+from datetime import datetime
 import logging
 from beanie import PydanticObjectId
+from beanie.operators import Or, Set
 
 # Models
 from app.models.estimate import Estimate, EstimateStatus
@@ -79,7 +81,6 @@ class EstimateRepository:
                 subtotal=float(breakdown.get('subtotal', 0.0)),
                 tax=float(breakdown.get('taxAmount', 0.0)),
                 total=float(breakdown.get('total', 0.0)),
-                public_token=str(uuid.uuid4()),
                 items=items
             )
             
@@ -124,6 +125,26 @@ class EstimateRepository:
         except Exception:
             return None
     
+    async def set_status_by_token(
+        self,
+        public_token: str,
+        status: EstimateStatus
+    ) -> bool:
+        """
+        Set the status of an unexpired estimate by public token.
+        
+        A single update_one; the estimate is not read first.
+        
+        Returns:
+            False if no unexpired estimate has this token
+        """
+        now = datetime.utcnow()
+        result = await Estimate.find_one(
+            Estimate.public_token == public_token,
+            Or(Estimate.expires_at == None, Estimate.expires_at > now)  # noqa: E711
+        ).update(Set({Estimate.status: status, Estimate.updated_at: now}))
+        return result.matched_count > 0
+    
     async def get_by_advisor(
         self,
         advisor_id: str,
@@ -131,6 +152,15 @@ class EstimateRepository:
         limit: int = 50
     ) -> List[Estimate]:
         """Get estimates by advisor."""
+        return [est async for est in self.iter_by_advisor(advisor_id, status, limit)]
+    
+    async def iter_by_advisor(
+        self,
+        advisor_id: str,
+        status: Optional[EstimateStatus] = None,
+        limit: int = 50
+    ) -> AsyncIterator[Estimate]:
+        """Yield an advisor's estimates newest first, straight off the cursor."""
         try:
             if advisor_id == "system":
                  query = Estimate.find_all()
@@ -139,17 +169,13 @@ class EstimateRepository:
             
             if status:
                 query = query.find(Estimate.status == status)
-                
-            estimates = await query.sort("-created_at").limit(limit).to_list()
             
-            # Populate relations for each estimate
-            for est in estimates:
+            async for est in query.sort("-created_at").limit(limit):
+                # Populate relations for each estimate
                 await self._populate_relations(est)
-                
-            return estimates
+                yield est
         except Exception as e:
             logger.error(f"Error getting estimates for advisor {advisor_id}: {e}")
-            return []
     
     async def update_status(
         self,
@@ -179,6 +205,24 @@ class EstimateRepository:
         await estimate.save()
         return estimate
 
+    async def mark_sent(
+        self,
+        estimate_id: str,
+        days: int = 7
+    ) -> Optional[Estimate]:
+        """Set status to SENT and the expiration date in a single update."""
+        estimate = await self.get_by_id(estimate_id)
+        if not estimate:
+            return None
+        
+        estimate.set_expiration(days)
+        await estimate.set({
+            Estimate.status: EstimateStatus.SENT,
+            Estimate.expires_at: estimate.expires_at,
+            Estimate.updated_at: datetime.utcnow()
+        })
+        return estimate
+
     async def update_estimate(
         self,
         estimate_id: str,
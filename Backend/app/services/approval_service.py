@@ -10,6 +10,7 @@ This service handles the customer-facing approval workflow:
 No login required - customers access via unique token.
 """
 from typing import Dict, Optional, List
+from collections import Counter
 from decimal import Decimal
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -48,12 +49,26 @@ class ApprovalService:
     # In-memory storage for development (replace with database in production)
     _tokens: Dict[str, Dict] = {}
     
+    # Running count of tokens per status, kept in step with _tokens so the
+    # dashboard stats don't walk every token
+    _status_counts: Counter = Counter()
+    
     # Token expiry (7 days)
     TOKEN_EXPIRY_DAYS = 7
     
     def __init__(self):
         self.base_url = getattr(settings, 'PUBLIC_URL', 'http://localhost:5173')
     
+    def _set_status(self, token_data: Dict, status: ApprovalStatus):
+        """Move a token to a new status and update the running counts."""
+        old_status = token_data.get("status")
+        if old_status == status.value:
+            return
+        if old_status is not None:
+            self._status_counts[old_status] -= 1
+        self._status_counts[status.value] += 1
+        token_data["status"] = status.value
+    
     def generate_approval_link(
         self,
         estimate_id: str,
@@ -86,10 +101,10 @@ class ApprovalService:
             "estimate_data": estimate_data,
             "created_at": datetime.utcnow().isoformat(),
             "expires_at": (datetime.utcnow() + timedelta(days=self.TOKEN_EXPIRY_DAYS)).isoformat(),
-            "status": ApprovalStatus.PENDING.value,
             "actions": []
         }
         
+        self._set_status(token_data, ApprovalStatus.PENDING)
         self._tokens[token] = token_data
         
         # Generate approval URL
@@ -136,7 +151,7 @@ Thank you for choosing us!
         # Check expiry
         expires_at = datetime.fromisoformat(token_data["expires_at"])
         if datetime.utcnow() > expires_at:
-            token_data["status"] = ApprovalStatus.EXPIRED.value
+            self._set_status(token_data, ApprovalStatus.EXPIRED)
             return {
                 "success": False,
                 "error": "This estimate link has expired",
@@ -211,7 +226,7 @@ Thank you for choosing us!
             }
         
         # Update status
-        token_data["status"] = new_status.value
+        self._set_status(token_data, new_status)
         token_data["actions"].append({
             "action": action,
             "timestamp": datetime.utcnow().isoformat(),
@@ -249,18 +264,7 @@ Thank you for choosing us!
         """
         total = len(self._tokens)
         
-        status_counts = {
-            ApprovalStatus.PENDING.value: 0,
-            ApprovalStatus.APPROVED.value: 0,
-            ApprovalStatus.DECLINED.value: 0,
-            ApprovalStatus.CALLBACK_REQUESTED.value: 0,
-            ApprovalStatus.EXPIRED.value: 0
-        }
-        
-        for token_data in self._tokens.values():
-            status = token_data["status"]
-            if status in status_counts:
-                status_counts[status] += 1
+        status_counts = self._status_counts
         
         approved = status_counts[ApprovalStatus.APPROVED.value]
         processed = approved + status_counts[ApprovalStatus.DECLINED.value]
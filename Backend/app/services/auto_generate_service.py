@@ -13,6 +13,7 @@ Orchestrates the entire estimate generation workflow automatically:
 
 This is the "brain" that automates the entire estimation process.
 """
+import asyncio
 from typing import Dict, List, Optional
 from decimal import Decimal
 
@@ -94,11 +95,25 @@ class AutoGenerateService:
         
         vehicle_info = None
         
+        # VIN decode, recall check (NHTSA), labor (ALLDATA) and parts
+        # (PartsLink24) only need the VIN and service request, so all four
+        # upstream calls run side by side. Errors are re-raised in each step
+        # below so they are reported exactly as before.
+        vin_outcome, recall_outcome, labor_outcome, parts_outcome = await asyncio.gather(
+            vin_decoder_service.decode_vin(vin),
+            recall_service.check_recalls(vin, service_request),
+            labor_service.get_labor_time(vin, service_request),
+            parts_service.search_parts(vin, service_request),
+            return_exceptions=True
+        )
+        
         # =====================================================================
         # STEP 1: Decode VIN
         # =====================================================================
         try:
-            vehicle_info = await vin_decoder_service.decode_vin(vin)
+            if isinstance(vin_outcome, Exception):
+                raise vin_outcome
+            vehicle_info = vin_outcome
             result["steps"]["vehicle_decode"] = {
                 "success": True,
                 "data": {
@@ -121,7 +136,9 @@ class AutoGenerateService:
         # STEP 2: NHTSA Recall Check
         # =====================================================================
         try:
-            recall_result = await recall_service.check_recalls(vin, service_request)
+            if isinstance(recall_outcome, Exception):
+                raise recall_outcome
+            recall_result = recall_outcome
             result["steps"]["recall_check"] = {
                 "success": recall_result.get("success", True),
                 "data": recall_result
@@ -173,7 +190,9 @@ class AutoGenerateService:
         labor_items = []
         job_type = "general"  # For cleaning kit selection
         try:
-            labor_result = await labor_service.get_labor_time(vin, service_request)
+            if isinstance(labor_outcome, Exception):
+                raise labor_outcome
+            labor_result = labor_outcome
             
             if labor_result:
                 labor_items.append(LaborItemSchema(
@@ -229,7 +248,9 @@ class AutoGenerateService:
         parts_results = []
         parts_items = []
         try:
-            parts_results = await parts_service.search_parts(vin, service_request)
+            if isinstance(parts_outcome, Exception):
+                raise parts_outcome
+            parts_results = parts_outcome
             
             if parts_results:
                 for part in parts_results:
@@ -20,6 +20,11 @@ from app.schemas.estimate import (
 )
 from app.core.config import settings
 
+# Shared constants, built once rather than per item
+_ZERO = Decimal("0")
+_CENT = Decimal("0.01")
+_HUNDRED = Decimal("100")
+
 
 # Service Cleaning Kits - replaces shop fees with transparent pricing
 CLEANING_KITS = {
@@ -92,12 +97,8 @@ class CalculationService:
         Returns:
             Total labor cost
         """
-        total = Decimal("0")
-        for item in labor_items:
-            item_total = Decimal(str(item.hours)) * Decimal(str(item.rate))
-            total += item_total
-        
-        return total.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        total = sum(map(self._labor_item_total, labor_items), _ZERO)
+        return total.quantize(_CENT, rounding=ROUND_HALF_UP)
     
     def calculate_parts_total(self, parts_items: List[PartItemSchema]) -> Decimal:
         """
@@ -111,22 +112,22 @@ class CalculationService:
         Returns:
             Total parts cost including markup
         """
-        total = Decimal("0")
-        for item in parts_items:
-            cost = Decimal(str(item.cost))
-            quantity = Decimal(str(item.quantity))
-            markup = Decimal(str(item.markup))
-            
-            # Calculate base cost
-            base_cost = cost * quantity
-            
-            # Apply markup
-            markup_multiplier = Decimal("1") + (markup / Decimal("100"))
-            item_total = base_cost * markup_multiplier
-            
-            total += item_total
-        
-        return total.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        total = sum(map(self._part_item_total, parts_items), _ZERO)
+        return total.quantize(_CENT, rounding=ROUND_HALF_UP)
+    
+    @staticmethod
+    def _labor_item_total(item: LaborItemSchema) -> Decimal:
+        """Unrounded hours × rate for one labor item."""
+        return Decimal(str(item.hours)) * Decimal(str(item.rate))
+    
+    @staticmethod
+    def _part_item_total(item: PartItemSchema) -> Decimal:
+        """Unrounded (cost × quantity) × (1 + markup/100) for one part."""
+        # Same value as base × (1 + markup/100), with one division instead of two
+        return (
+            Decimal(str(item.cost)) * Decimal(str(item.quantity))
+            * (_HUNDRED + Decimal(str(item.markup))) / _HUNDRED
+        )
     
     def calculate_estimate(
         self,
@@ -170,14 +171,11 @@ class CalculationService:
         subtotal = labor_total + parts_total
         
         # Calculate tax on subtotal
-        tax_amount = (subtotal * effective_tax_rate).quantize(
-            Decimal("0.01"), 
-            rounding=ROUND_HALF_UP
-        )
+        tax_amount = (subtotal * effective_tax_rate).quantize(_CENT, rounding=ROUND_HALF_UP)
         
         # Get cleaning kit
         cleaning_kit_data = None
-        cleaning_kit_price = Decimal("0")
+        cleaning_kit_price = _ZERO
         
         if include_cleaning_kit:
             kit = self.get_cleaning_kit(job_type)
@@ -219,31 +217,20 @@ class CalculationService:
             Dictionary with updated labor and parts items
         """
         # Recalculate labor item totals
-        updated_labor = []
-        for item in labor_items:
-            item_total = (
-                Decimal(str(item.hours)) * Decimal(str(item.rate))
-            ).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-            
-            updated_item = item.model_copy(update={"total": item_total})
-            updated_labor.append(updated_item)
+        updated_labor = [
+            item.model_copy(update={
+                "total": self._labor_item_total(item).quantize(_CENT, rounding=ROUND_HALF_UP)
+            })
+            for item in labor_items
+        ]
         
         # Recalculate parts item totals
-        updated_parts = []
-        for item in parts_items:
-            cost = Decimal(str(item.cost))
-            quantity = Decimal(str(item.quantity))
-            markup = Decimal(str(item.markup))
-            
-            base_cost = cost * quantity
-            markup_multiplier = Decimal("1") + (markup / Decimal("100"))
-            item_total = (base_cost * markup_multiplier).quantize(
-                Decimal("0.01"), 
-                rounding=ROUND_HALF_UP
-            )
-            
-            updated_item = item.model_copy(update={"total": item_total})
-            updated_parts.append(updated_item)
+        updated_parts = [
+            item.model_copy(update={
+                "total": self._part_item_total(item).quantize(_CENT, rounding=ROUND_HALF_UP)
+            })
+            for item in parts_items
+        ]
         
         return {
             "laborItems": updated_labor,
@@ -7,8 +7,10 @@ Orchestrates estimate operations by coordinating between:
 
 This is the main service layer that API routes will use.
 """
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
+from datetime import datetime
 from decimal import Decimal
+from cachetools import TTLCache
 
 from app.schemas.estimate import (
     EstimateCreateSchema,
@@ -25,6 +27,12 @@ from app.services.calculation_service import calculation_service
 from app.repositories.estimate_repository import EstimateRepository
 from app.models.estimate import Estimate, EstimateStatus
 from app.models.estimate_item import ItemType
+from app.utils.async_cache import cached_call, invalidate
+
+# Customer-portal responses by public token. A portal link is opened and
+# refreshed many times while the estimate stays the same; every write path
+# below drops the token's entry, and the TTL bounds anything missed.
+_token_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
 
 
 class EstimateService:
@@ -134,7 +142,8 @@ class EstimateService:
         
         if not estimate:
             return None
-            
+        
+        await invalidate(_token_cache, estimate.public_token)
         return self._estimate_to_response(estimate)
     
     async def get_estimate(self, estimate_id: str) -> Optional[EstimateResponseSchema]:
@@ -146,7 +155,21 @@ class EstimateService:
         return self._estimate_to_response(estimate)
     
     async def get_estimate_by_token(self, public_token: str) -> Optional[EstimateResponseSchema]:
-        """Get estimate by public token."""
+        """Get estimate by public token (cached, see _token_cache)."""
+        response = await cached_call(
+            _token_cache,
+            public_token,
+            lambda: self._load_estimate_by_token(public_token),
+            store=lambda r: r is not None
+        )
+        
+        # A cached entry can outlive the link itself
+        if response and response.expiresAt and datetime.utcnow() > response.expiresAt:
+            return None
+        
+        return response
+    
+    async def _load_estimate_by_token(self, public_token: str) -> Optional[EstimateResponseSchema]:
         estimate = await self.repository.get_by_token(public_token)
         if not estimate:
             return None
@@ -157,27 +180,50 @@ class EstimateService:
         
         return self._estimate_to_response(estimate)
     
+    async def respond_by_token(self, public_token: str, status: EstimateStatus) -> bool:
+        """
+        Record the customer's approve/decline on an unexpired estimate.
+        
+        Returns:
+            False if no unexpired estimate has this token
+        """
+        updated = await self.repository.set_status_by_token(public_token, status)
+        await invalidate(_token_cache, public_token)
+        return updated
+    
     async def get_advisor_estimates(
         self,
         advisor_id: str,
         status: Optional[str] = None
     ) -> List[EstimateResponseSchema]:
         """Get all estimates for an advisor."""
+        return [est async for est in self.stream_advisor_estimates(advisor_id, status)]
+    
+    def stream_advisor_estimates(
+        self,
+        advisor_id: str,
+        status: Optional[str] = None
+    ) -> AsyncIterator[EstimateResponseSchema]:
+        """
+        Yield an advisor's estimates one at a time as they are read.
+        The status is checked up front, before anything is streamed.
+        """
         status_enum = EstimateStatus(status) if status else None
-        estimates = await self.repository.get_by_advisor(advisor_id, status_enum)
         
-        return [self._estimate_to_response(est) for est in estimates]
+        async def responses():
+            async for est in self.repository.iter_by_advisor(advisor_id, status_enum):
+                yield self._estimate_to_response(est)
+        
+        return responses()
     
     async def send_estimate(self, estimate_id: str, days_valid: int = 7) -> Optional[EstimateResponseSchema]:
         """Send estimate to customer."""
-        # Update status to 'sent'
-        estimate = await self.repository.update_status(estimate_id, EstimateStatus.SENT)
+        # Status and expiration go out in one update
+        estimate = await self.repository.mark_sent(estimate_id, days_valid)
         if not estimate:
             return None
         
-        # Set expiration
-        estimate = await self.repository.set_expiration(estimate_id, days_valid)
-        
+        await invalidate(_token_cache, estimate.public_token)
         return self._estimate_to_response(estimate)
     
     # ========================================================================
@@ -289,8 +335,12 @@ class EstimateService:
         )
 
 
+# Singleton instance (the service holds no per-request state)
+estimate_service = EstimateService()
+
+
 def get_estimate_service() -> EstimateService:
     """
-    Factory function to create EstimateService instance.
+    Return the shared EstimateService instance.
     """
-    return EstimateService()
\ No newline at end of file
+    return estimate_service
@@ -8,8 +8,8 @@ Safety-critical feature: Flags vehicles with potential recall matches.
 """
 from typing import Dict, List, Optional
 from dataclasses import dataclass
-import httpx
 import asyncio
+from app.utils.http_client import get_http_client
 
 
 @dataclass
@@ -42,29 +42,30 @@ class RecallService:
             List of RecallInfo objects
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    self.NHTSA_API_BASE,
-                    params={"vin": vin}
-                )
-                
-                if response.status_code != 200:
-                    return []
-                
-                data = response.json()
-                recalls = []
-                
-                for result in data.get("results", []):
-                    recalls.append(RecallInfo(
-                        campaign_number=result.get("NHTSACampaignNumber", ""),
-                        manufacturer=result.get("Manufacturer", ""),
-                        component=result.get("Component", ""),
-                        summary=result.get("Summary", ""),
-                        consequence=result.get("Consequence", ""),
-                        remedy=result.get("Remedy", "")
-                    ))
-                
-                return recalls
+            client = get_http_client()
+            response = await client.get(
+                self.NHTSA_API_BASE,
+                params={"vin": vin},
+                timeout=self.timeout
+            )
+            
+            if response.status_code != 200:
+                return []
+            
+            data = response.json()
+            recalls = []
+            
+            for result in data.get("results", []):
+                recalls.append(RecallInfo(
+                    campaign_number=result.get("NHTSACampaignNumber", ""),
+                    manufacturer=result.get("Manufacturer", ""),
+                    component=result.get("Component", ""),
+                    summary=result.get("Summary", ""),
+                    consequence=result.get("Consequence", ""),
+                    remedy=result.get("Remedy", "")
+                ))
+            
+            return recalls
                 
         except Exception as e:
             print(f"NHTSA API error: {e}")
@@ -13,10 +13,10 @@ from typing import Dict, Optional
 from decimal import Decimal
 from dataclasses import dataclass
 from datetime import datetime
-import httpx
 import uuid
 
 from app.core.config import settings
+from app.utils.http_client import get_http_client
 
 
 @dataclass
@@ -85,50 +85,52 @@ class TekmetricService:
         last_name = name_parts[1] if len(name_parts) > 1 else ""
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # First, try to find existing customer by phone
-                search_response = await client.get(
-                    f"{self.API_BASE}/customers",
-                    headers=self._get_headers(),
-                    params={"phone": phone, "shopId": self.shop_id}
-                )
-                
-                if search_response.status_code == 200:
-                    customers = search_response.json().get("data", [])
-                    if customers:
-                        return {
-                            "success": True,
-                            "customer_id": customers[0]["id"],
-                            "name": name,
-                            "is_new": False
-                        }
-                
-                # Create new customer
-                create_response = await client.post(
-                    f"{self.API_BASE}/customers",
-                    headers=self._get_headers(),
-                    json={
-                        "shopId": self.shop_id,
-                        "firstName": first_name,
-                        "lastName": last_name,
-                        "phone": phone,
-                        "email": email
-                    }
-                )
-                
-                if create_response.status_code in [200, 201]:
-                    data = create_response.json()
+            client = get_http_client()
+            # First, try to find existing customer by phone
+            search_response = await client.get(
+                f"{self.API_BASE}/customers",
+                headers=self._get_headers(),
+                params={"phone": phone, "shopId": self.shop_id},
+                timeout=self.timeout
+            )
+            
+            if search_response.status_code == 200:
+                customers = search_response.json().get("data", [])
+                if customers:
                     return {
                         "success": True,
-                        "customer_id": data.get("id"),
+                        "customer_id": customers[0]["id"],
                         "name": name,
-                        "is_new": True
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": f"Failed to create customer: {create_response.text}"
+                        "is_new": False
                     }
+            
+            # Create new customer
+            create_response = await client.post(
+                f"{self.API_BASE}/customers",
+                headers=self._get_headers(),
+                json={
+                    "shopId": self.shop_id,
+                    "firstName": first_name,
+                    "lastName": last_name,
+                    "phone": phone,
+                    "email": email
+                },
+                timeout=self.timeout
+            )
+            
+            if create_response.status_code in [200, 201]:
+                data = create_response.json()
+                return {
+                    "success": True,
+                    "customer_id": data.get("id"),
+                    "name": name,
+                    "is_new": True
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": f"Failed to create customer: {create_response.text}"
+                }
                     
         except Exception as e:
             return {
@@ -172,52 +174,54 @@ class TekmetricService:
             }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # First, try to find existing vehicle by VIN
-                search_response = await client.get(
-                    f"{self.API_BASE}/vehicles",
-                    headers=self._get_headers(),
-                    params={"vin": vin, "shopId": self.shop_id}
-                )
-                
-                if search_response.status_code == 200:
-                    vehicles = search_response.json().get("data", [])
-                    if vehicles:
-                        return {
-                            "success": True,
-                            "vehicle_id": vehicles[0]["id"],
-                            "vin": vin,
-                            "is_new": False
-                        }
-                
-                # Create new vehicle
-                create_response = await client.post(
-                    f"{self.API_BASE}/vehicles",
-                    headers=self._get_headers(),
-                    json={
-                        "shopId": self.shop_id,
-                        "customerId": customer_id,
-                        "vin": vin,
-                        "year": year,
-                        "make": make,
-                        "model": model,
-                        "mileageIn": mileage
-                    }
-                )
-                
-                if create_response.status_code in [200, 201]:
-                    data = create_response.json()
+            client = get_http_client()
+            # First, try to find existing vehicle by VIN
+            search_response = await client.get(
+                f"{self.API_BASE}/vehicles",
+                headers=self._get_headers(),
+                params={"vin": vin, "shopId": self.shop_id},
+                timeout=self.timeout
+            )
+            
+            if search_response.status_code == 200:
+                vehicles = search_response.json().get("data", [])
+                if vehicles:
                     return {
                         "success": True,
-                        "vehicle_id": data.get("id"),
+                        "vehicle_id": vehicles[0]["id"],
                         "vin": vin,
-                        "is_new": True
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": f"Failed to create vehicle: {create_response.text}"
+                        "is_new": False
                     }
+            
+            # Create new vehicle
+            create_response = await client.post(
+                f"{self.API_BASE}/vehicles",
+                headers=self._get_headers(),
+                json={
+                    "shopId": self.shop_id,
+                    "customerId": customer_id,
+                    "vin": vin,
+                    "year": year,
+                    "make": make,
+                    "model": model,
+                    "mileageIn": mileage
+                },
+                timeout=self.timeout
+            )
+            
+            if create_response.status_code in [200, 201]:
+                data = create_response.json()
+                return {
+                    "success": True,
+                    "vehicle_id": data.get("id"),
+                    "vin": vin,
+                    "is_new": True
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": f"Failed to create vehicle: {create_response.text}"
+                }
                     
         except Exception as e:
             return {
@@ -314,63 +318,66 @@ class TekmetricService:
             }
         else:
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    # Create repair order
-                    ro_response = await client.post(
-                        f"{self.API_BASE}/repair-orders",
-                        headers=self._get_headers(),
-                        json={
-                            "shopId": self.shop_id,
-                            "customerId": customer_id,
-                            "vehicleId": vehicle_id,
-                            "status": "estimate"
-                        }
-                    )
-                    
-                    if ro_response.status_code in [200, 201]:
-                        ro_data = ro_response.json()
-                        ro_id = ro_data.get("id")
-                        
-                        # Add labor items
-                        for labor in labor_items:
-                            await client.post(
-                                f"{self.API_BASE}/repair-orders/{ro_id}/labor",
-                                headers=self._get_headers(),
-                                json={
-                                    "description": labor.get("description"),
-                                    "hours": float(labor.get("hours", 0)),
-                                    "rate": float(labor.get("rate", 0))
-                                }
-                            )
-                        
-                        # Add parts items
-                        for part in parts_items:
-                            await client.post(
-                                f"{self.API_BASE}/repair-orders/{ro_id}/parts",
-                                headers=self._get_headers(),
-                                json={
-                                    "description": part.get("description"),
-                                    "partNumber": part.get("partNumber"),
-                                    "quantity": float(part.get("quantity", 1)),
-                                    "cost": float(part.get("cost", 0)),
-                                    "price": float(part.get("total", 0))
-                                }
-                            )
-                        
-                        result["steps"]["repair_order"] = {
-                            "success": True,
-                            "ro_id": ro_id,
-                            "ro_number": ro_data.get("roNumber", ro_number)
-                        }
-                        result["tekmetric"] = {
-                            "ro_number": ro_data.get("roNumber", ro_number),
-                            "estimate_id": ro_id,
-                            "status": "created",
-                            "view_url": f"https://app.tekmetric.com/ro/{ro_id}"
-                        }
-                    else:
-                        result["success"] = False
-                        result["error"] = f"Failed to create RO: {ro_response.text}"
+                client = get_http_client()
+                # Create repair order
+                ro_response = await client.post(
+                    f"{self.API_BASE}/repair-orders",
+                    headers=self._get_headers(),
+                    json={
+                        "shopId": self.shop_id,
+                        "customerId": customer_id,
+                        "vehicleId": vehicle_id,
+                        "status": "estimate"
+                    },
+                    timeout=self.timeout
+                )
+                
+                if ro_response.status_code in [200, 201]:
+                    ro_data = ro_response.json()
+                    ro_id = ro_data.get("id")
+                
+                    # Add labor items
+                    for labor in labor_items:
+                        await client.post(
+                            f"{self.API_BASE}/repair-orders/{ro_id}/labor",
+                            headers=self._get_headers(),
+                            json={
+                                "description": labor.get("description"),
+                                "hours": float(labor.get("hours", 0)),
+                                "rate": float(labor.get("rate", 0))
+                            },
+                            timeout=self.timeout
+                        )
+                
+                    # Add parts items
+                    for part in parts_items:
+                        await client.post(
+                            f"{self.API_BASE}/repair-orders/{ro_id}/parts",
+                            headers=self._get_headers(),
+                            json={
+                                "description": part.get("description"),
+                                "partNumber": part.get("partNumber"),
+                                "quantity": float(part.get("quantity", 1)),
+                                "cost": float(part.get("cost", 0)),
+                                "price": float(part.get("total", 0))
+                            },
+                            timeout=self.timeout
+                        )
+                
+                    result["steps"]["repair_order"] = {
+                        "success": True,
+                        "ro_id": ro_id,
+                        "ro_number": ro_data.get("roNumber", ro_number)
+                    }
+                    result["tekmetric"] = {
+                        "ro_number": ro_data.get("roNumber", ro_number),
+                        "estimate_id": ro_id,
+                        "status": "created",
+                        "view_url": f"https://app.tekmetric.com/ro/{ro_id}"
+                    }
+                else:
+                    result["success"] = False
+                    result["error"] = f"Failed to create RO: {ro_response.text}"
                         
             except Exception as e:
                 result["success"] = False
@@ -402,24 +409,25 @@ class TekmetricService:
             }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.patch(
-                    f"{self.API_BASE}/repair-orders/{ro_id}",
-                    headers=self._get_headers(),
-                    json={"status": status}
-                )
-                
-                if response.status_code == 200:
-                    return {
-                        "success": True,
-                        "ro_id": ro_id,
-                        "status": status
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": response.text
-                    }
+            client = get_http_client()
+            response = await client.patch(
+                f"{self.API_BASE}/repair-orders/{ro_id}",
+                headers=self._get_headers(),
+                json={"status": status},
+                timeout=self.timeout
+            )
+            
+            if response.status_code == 200:
+                return {
+                    "success": True,
+                    "ro_id": ro_id,
+                    "status": status
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": response.text
+                }
         except Exception as e:
             return {
                 "success": False,
@@ -8,7 +8,8 @@ This service handles:
 
 Based on the Estimaro Automation Workflow specification.
 """
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
 from decimal import Decimal, ROUND_HALF_UP
 from dataclasses import dataclass
 from enum import Enum
@@ -114,7 +115,8 @@ class VendorService:
         self,
         offer: VendorOffer,
         all_offers: List[VendorOffer],
-        weights: VendorWeights
+        weights: VendorWeights,
+        price_range: Optional[Tuple[float, float]] = None
     ) -> ScoredOffer:
         """
         Calculate composite score for a vendor offer.
@@ -130,6 +132,8 @@ class VendorService:
             offer: The vendor offer to score
             all_offers: All offers for price normalization
             weights: Shop-configured scoring weights
+            price_range: Precomputed (min, max) of the valid prices in
+                all_offers; computed here when not given
             
         Returns:
             ScoredOffer with calculated scores
@@ -144,10 +148,10 @@ class VendorService:
         brand_score = float(offer.brand_tier.value)
         
         # Price score (inverse - lower is better)
-        prices = [float(o.price) for o in all_offers if o.price > 0]
-        if prices:
-            max_price = max(prices)
-            min_price = min(prices)
+        if price_range is None:
+            price_range = self._price_range(all_offers)
+        if price_range:
+            min_price, max_price = price_range
             if max_price != min_price:
                 price_score = 10 - ((float(offer.price) - min_price) / (max_price - min_price)) * 10
             else:
@@ -175,6 +179,14 @@ class VendorService:
             selection=""  # Will be set after ranking
         )
 
+    @staticmethod
+    def _price_range(offers: List[VendorOffer]) -> Optional[Tuple[float, float]]:
+        """(min, max) of the offers' positive prices, or None if there are none"""
+        prices = [float(o.price) for o in offers if o.price > 0]
+        if not prices:
+            return None
+        return min(prices), max(prices)
+
     def score_and_rank_offers(
         self,
         offers: List[VendorOffer],
@@ -195,9 +207,10 @@ class VendorService:
         
         weights = weights or VendorWeights()
         
-        # Score all offers
+        # Score all offers (price bounds are shared, so compute them once)
+        price_range = self._price_range(offers)
         scored_offers = [
-            self.calculate_vendor_score(offer, offers, weights)
+            self.calculate_vendor_score(offer, offers, weights, price_range)
             for offer in offers
         ]
         
@@ -236,26 +249,28 @@ class VendorService:
             from app.adapters.remote_adapters import RemoteVendorAdapter
             adapters.append(RemoteVendorAdapter())
 
+        from app.adapters.vendor_adapter_interface import gather_prices
+
+        # All vendors in parallel; pass VIN and job_description for Worldpac complete search flow
+        results = await gather_prices(adapters, part_numbers, vin=vin, job_description=job_description)
+        
         all_offers = []
-        for adapter in adapters:
-            # Pass VIN and job_description for Worldpac complete search flow
-            results = await adapter.get_prices(part_numbers, vin=vin, job_description=job_description)
-            for res in results:
-                # Map VendorPriceResult to VendorOffer
-                all_offers.append(VendorOffer(
-                    vendor_id=res.vendor_id,
-                    vendor_name=res.vendor_name,
-                    brand=res.brand,
-                    brand_tier=self.get_brand_tier(res.brand),
-                    part_number=res.part_number,
-                    price=res.price,
-                    stock_status=res.stock_status,
-                    stock_quantity=res.stock_quantity,
-                    warehouse_location=res.warehouse_location,
-                    warehouse_distance_miles=res.warehouse_distance_miles,
-                    delivery_option=res.delivery_option,
-                    warranty=res.warranty
-                ))
+        for res in results:
+            # Map VendorPriceResult to VendorOffer
+            all_offers.append(VendorOffer(
+                vendor_id=res.vendor_id,
+                vendor_name=res.vendor_name,
+                brand=res.brand,
+                brand_tier=self.get_brand_tier(res.brand),
+                part_number=res.part_number,
+                price=res.price,
+                stock_status=res.stock_status,
+                stock_quantity=res.stock_quantity,
+                warehouse_location=res.warehouse_location,
+                warehouse_distance_miles=res.warehouse_distance_miles,
+                delivery_option=res.delivery_option,
+                warranty=res.warranty
+            ))
         return all_offers
 
     async def compare_vendors(
@@ -290,9 +305,13 @@ class VendorService:
             "parts": []
         }
         
+        # Group offers by part once instead of filtering the full list per part
+        offers_by_part = defaultdict(list)
+        for o in all_fetched_offers:
+            offers_by_part[o.part_number].append(o)
+        
         for part_num, part_desc in zip(part_numbers, part_descriptions):
-            # Filter offers for this part
-            offers = [o for o in all_fetched_offers if o.part_number == part_num]
+            offers = offers_by_part.get(part_num, [])
             
             # Score and rank
             scored_offers = self.score_and_rank_offers(offers, weights)
@@ -6,9 +6,38 @@ to decode VIN and retrieve vehicle information.
 
 API Documentation: https://vpic.nhtsa.dot.gov/api/
 """
-import httpx
-from typing import Optional, Dict
+import asyncio
+import re
+from typing import Optional, Dict, Set
+from cachetools import TTLCache
 from pydantic import BaseModel, Field
+from app.utils.async_cache import cached_call
+from app.utils.http_client import get_http_client
+
+# Decoded vehicles by VIN. NHTSA data for a VIN doesn't change, so a day's
+# TTL only bounds memory and picks up upstream corrections.
+_decode_cache: TTLCache = TTLCache(maxsize=4096, ttl=86400)
+
+# ISO 3779: 17 characters, letters I, O and Q are never used
+_VIN_RE = re.compile(r"^[A-HJ-NPR-Z0-9]{17}$")
+
+
+def normalize_vin(vin: str) -> str:
+    """
+    Upper-case a VIN and check its length and character set.
+    
+    The check digit (position 9) is not verified: it is only mandatory for
+    North American VINs, and European VINs routinely fail it.
+    
+    Raises:
+        ValueError: If the VIN is malformed
+    """
+    if not vin or len(vin) != 17:
+        raise ValueError("VIN must be exactly 17 characters")
+    vin = vin.upper()
+    if not _VIN_RE.match(vin):
+        raise ValueError("VIN may only contain digits and letters other than I, O and Q")
+    return vin
 
 
 class VehicleDecodeResult(BaseModel):
@@ -40,9 +69,25 @@ class VehicleDecodeResult(BaseModel):
 
 
 class VINDecoderService:
-    """Service for decoding VINs using NHTSA API"""
+    """
+    Service for decoding VINs using NHTSA API.
     
-    NHTSA_API_URL = "https://vpic.nhtsa.dot.gov/api/vehicles/DecodeVin/{vin}?format=json"
+    Concurrent decodes are coalesced: VINs requested within a short window
+    are sent together to NHTSA's batch endpoint, and callers asking for the
+    same VIN share one lookup. Decoded VINs are then served from memory.
+    """
+    
+    NHTSA_BATCH_URL = "https://vpic.nhtsa.dot.gov/api/vehicles/DecodeVINValuesBatch/"
+    
+    # How long a decode waits for others to join its batch, and NHTSA's
+    # per-request VIN limit
+    BATCH_WINDOW_SECONDS = 0.075
+    BATCH_MAX_VINS = 50
+    
+    def __init__(self):
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._batch_tasks: Set[asyncio.Task] = set()
+        self._window_task: Optional[asyncio.Task] = None
     
     async def decode_vin(self, vin: str) -> VehicleDecodeResult:
         """
@@ -56,47 +101,104 @@ class VINDecoderService:
             
         Raises:
             ValueError: If VIN is invalid
+            LookupError: If NHTSA returns no make or year for the VIN
             httpx.HTTPError: If API request fails
         """
-        # Validate VIN format
-        if not vin or len(vin) != 17:
-            raise ValueError("VIN must be exactly 17 characters")
+        vin = normalize_vin(vin)
+        return await cached_call(_decode_cache, vin, lambda: self._decode_batched(vin))
+    
+    def forget(self, vin: str) -> bool:
+        """
+        Drop a VIN's cached decode so the next lookup asks NHTSA again.
         
-        # Make API request
-        url = self.NHTSA_API_URL.format(vin=vin.upper())
+        Returns:
+            True if the VIN was cached
+        """
+        return _decode_cache.pop(normalize_vin(vin), None) is not None
+    
+    async def _decode_batched(self, vin: str) -> VehicleDecodeResult:
+        """Queue a VIN for the next batch request and wait for its result."""
+        future = self._pending.get(vin)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[vin] = future
+            if len(self._pending) >= self.BATCH_MAX_VINS:
+                self._spawn(self._send_batch(self._take_pending()))
+            elif self._window_task is None:
+                self._window_task = self._spawn(self._flush_after_window())
+        
+        # Shielded so one caller giving up doesn't cancel a shared lookup
+        return await asyncio.shield(future)
+    
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+        return task
+    
+    def _take_pending(self) -> Dict[str, asyncio.Future]:
+        batch, self._pending = self._pending, {}
+        return batch
+    
+    async def _flush_after_window(self):
+        await asyncio.sleep(self.BATCH_WINDOW_SECONDS)
+        self._window_task = None
+        await self._send_batch(self._take_pending())
+    
+    async def _send_batch(self, batch: Dict[str, asyncio.Future]):
+        """Decode a batch of VINs in one request and resolve their futures."""
+        if not batch:
+            return
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url)
+        try:
+            client = get_http_client()
+            response = await client.post(
+                self.NHTSA_BATCH_URL,
+                data={"format": "json", "data": ";".join(batch)},
+                timeout=10.0
+            )
             response.raise_for_status()
-            data = response.json()
+            rows = {
+                (row.get("VIN") or "").upper(): row
+                for row in response.json().get("Results", [])
+            }
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
         
-        # Parse response
-        return self._parse_nhtsa_response(vin, data)
+        for vin, future in batch.items():
+            if future.done():
+                continue
+            result = self._parse_nhtsa_row(vin, rows.get(vin, {}))
+            if not result.make and not result.year:
+                # Missing or empty row - fail it so the blank vehicle isn't cached
+                future.set_exception(LookupError(f"NHTSA could not decode VIN {vin}"))
+            else:
+                future.set_result(result)
     
-    def _parse_nhtsa_response(self, vin: str, data: Dict) -> VehicleDecodeResult:
+    def _parse_nhtsa_row(self, vin: str, row: Dict) -> VehicleDecodeResult:
         """
-        Parse NHTSA API response.
+        Parse one row of an NHTSA batch response.
         
-        NHTSA returns data in format:
+        NHTSA returns one flat row per VIN:
         {
             "Results": [
-                {"Variable": "Make", "Value": "HONDA"},
-                {"Variable": "Model", "Value": "Accord"},
+                {"VIN": "...", "Make": "HONDA", "Model": "Accord", "ModelYear": "2021", ...},
                 ...
             ]
         }
         """
-        results = data.get("Results", [])
-        
-        # Create a dictionary for easy lookup
+        # Drop empty and placeholder values
         vehicle_data = {
-            item["Variable"]: item["Value"] 
-            for item in results 
-            if item.get("Value") and item["Value"] != "Not Applicable"
+            key: value
+            for key, value in row.items()
+            if value and value != "Not Applicable"
         }
         
         # Extract relevant fields
-        year_str = vehicle_data.get("Model Year")
+        year_str = vehicle_data.get("ModelYear")
         year = int(year_str) if year_str and year_str.isdigit() else None
         
         return VehicleDecodeResult(
@@ -105,10 +207,10 @@ class VINDecoderService:
             make=vehicle_data.get("Make"),
             model=vehicle_data.get("Model"),
             trim=vehicle_data.get("Trim"),
-            engine=vehicle_data.get("Engine Model") or vehicle_data.get("Engine Configuration"),
-            manufacturer=vehicle_data.get("Manufacturer Name"),
-            vehicleType=vehicle_data.get("Vehicle Type"),
-            bodyClass=vehicle_data.get("Body Class")
+            engine=vehicle_data.get("EngineModel") or vehicle_data.get("EngineConfiguration"),
+            manufacturer=vehicle_data.get("Manufacturer"),
+            vehicleType=vehicle_data.get("VehicleType"),
+            bodyClass=vehicle_data.get("BodyClass")
         )
 
 
@@ -0,0 +1,70 @@
+"""
+Async Cache Helper
+
+Single-flight lookups over a cachetools TTLCache: the first caller on a miss
+runs the fetch, concurrent callers for the same key wait for it and read
+the cached result instead of repeating the upstream call.
+
+invalidate() drops an entry after a write without racing a fetch that is
+still loading the old data.
+
+Used by the labor/parts adapters, the VIN decoder and the estimate portal.
+"""
+import asyncio
+import weakref
+from typing import Awaitable, Callable, Hashable, Optional, TypeVar
+
+from cachetools import TTLCache
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+# One lock per in-flight (cache, key); dropped once no caller holds it
+_inflight_locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+
+def _lock_for(cache: TTLCache, key: Hashable) -> asyncio.Lock:
+    lock_key = (id(cache), key)
+    lock = _inflight_locks.get(lock_key)
+    if lock is None:
+        lock = _inflight_locks[lock_key] = asyncio.Lock()
+    return lock
+
+
+async def cached_call(
+    cache: TTLCache,
+    key: Hashable,
+    fetch: Callable[[], Awaitable[T]],
+    store: Optional[Callable[[T], bool]] = None
+) -> T:
+    """
+    Return cache[key], calling fetch() once per key on a miss.
+
+    Exceptions from fetch() propagate and are never cached. `store` can veto
+    caching a result (e.g. fallback data that should be retried next time).
+    """
+    cached = cache.get(key, _MISSING)
+    if cached is not _MISSING:
+        return cached
+
+    async with _lock_for(cache, key):
+        # Another request may have filled it while we waited
+        cached = cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        result = await fetch()
+        if store is None or store(result):
+            cache[key] = result
+        return result
+
+
+async def invalidate(cache: TTLCache, key: Hashable) -> None:
+    """
+    Drop cache[key] after the underlying data changed.
+
+    Waits out any in-flight fetch for the key first, so a fetch that read the
+    old data can't store it back after the drop.
+    """
+    async with _lock_for(cache, key):
+        cache.pop(key, None)
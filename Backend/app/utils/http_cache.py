@@ -0,0 +1,39 @@
+"""
+HTTP Cache Helpers
+
+Conditional GET support for endpoints that clients poll (estimate detail,
+approval view). The endpoint builds an ETag from whatever identifies the
+current version of the payload; a matching If-None-Match gets a bodiless
+304 instead of the serialized response.
+"""
+from typing import Optional
+
+from fastapi import Request, Response
+
+# Clients may reuse a response briefly without asking again; after that they
+# revalidate with If-None-Match
+CACHE_CONTROL = "private, max-age=5"
+
+
+def weak_etag(*parts) -> str:
+    """Build a weak ETag from the parts that identify a payload version"""
+    return 'W/"' + "-".join(str(p) for p in parts) + '"'
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Return a 304 response if the client already has this version.
+
+    Otherwise sets ETag/Cache-Control on the endpoint's response and returns
+    None so the endpoint carries on and returns its payload.
+    """
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = [t.strip() for t in if_none_match.split(",")]
+        if "*" in tags or etag in tags:
+            return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
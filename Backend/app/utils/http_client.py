@@ -0,0 +1,48 @@
+"""
+Shared HTTP Client
+
+One pooled httpx.AsyncClient for the backend's outbound API calls (NHTSA,
+Tekmetric, the Scraper Service). Reusing it keeps connections alive between
+calls instead of paying a TCP+TLS handshake on every request.
+
+Callers pass their own timeout per request. The client is closed from the
+app's shutdown hook.
+"""
+import logging
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=10.0,
+        )
+    return _client
+
+
+async def close_http_client():
+    """Close the shared client and its pooled connections"""
+    global _client
+    if _client is None:
+        return
+    try:
+        await _client.aclose()
+    except Exception as e:
+        logger.warning(f"HTTP CLIENT: Error while closing: {e}")
+    _client = None
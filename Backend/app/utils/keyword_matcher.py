@@ -0,0 +1,67 @@
+"""
+Keyword Matcher
+
+Compiles a fixed set of lowercase keywords into a single regex so that
+"which keywords appear in this text?" is answered by one scan in the C
+regex engine instead of a Python-level `keyword in text` loop.
+
+Used by the mock adapters and the scraper fallback estimators, which all
+match a job description against a static keyword table.
+"""
+import re
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class KeywordMatcher:
+    """
+    Substring matcher over a fixed, ordered keyword set.
+
+    Results keep the semantics of the original `for keyword in table:
+    if keyword in text` loops: `first()` returns the earliest keyword in
+    table order that occurs anywhere in the text, and `all()` returns every
+    occurring keyword in table order.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        # Interned so the dict lookups on matched keywords compare by identity
+        self.keywords: Tuple[str, ...] = tuple(
+            dict.fromkeys(sys.intern(k.lower()) for k in keywords)
+        )
+        self._rank: Dict[str, int] = {k: i for i, k in enumerate(self.keywords)}
+
+        # Longest alternatives first, so at any position the regex reports the
+        # longest keyword starting there. A lookahead lets matches overlap.
+        by_length = sorted(self.keywords, key=len, reverse=True)
+        self._pattern = re.compile(
+            "(?=(" + "|".join(re.escape(k) for k in by_length) + "))"
+        ) if self.keywords else None
+
+        # Shorter keywords that are a prefix of a longer one start at the same
+        # position and are shadowed by it, e.g. "oil" inside "oil filter".
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            k: tuple(p for p in self.keywords if p != k and k.startswith(p))
+            for k in self.keywords
+        }
+
+    def _found(self, text: str) -> set:
+        found = set()
+        if self._pattern is None:
+            return found
+        for match in self._pattern.finditer(text):
+            keyword = match.group(1)
+            found.add(keyword)
+            found.update(self._prefixes[keyword])
+        return found
+
+    def first(self, text: str) -> Optional[str]:
+        """Return the first keyword (in table order) contained in `text`."""
+        found = self._found(text)
+        if not found:
+            return None
+        return min(found, key=self._rank.__getitem__)
+
+    def all(self, text: str) -> List[str]:
+        """Return every keyword contained in `text`, in table order."""
+        found = self._found(text)
+        return [k for k in self.keywords if k in found]
@@ -0,0 +1,72 @@
+"""
+Vendor Price Cache
+
+On-disk TTL cache of live-scraped vendor offers, keyed by vendor and part
+number. Vendor prices move hourly to daily, not per request, so a repeat
+lookup inside the TTL is answered from disk without launching a browser.
+
+Only successful scrapes are stored; fallback rows are never cached.
+"""
+import asyncio
+import dataclasses
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from decimal import Decimal
+from typing import Optional
+
+import orjson
+
+from app.adapters.vendor_adapter_interface import VendorPriceResult
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(".cache", "prices")
+DEFAULT_TTL_SECONDS = 3600
+
+
+def _path(vendor: str, part_number: str) -> str:
+    key = hashlib.md5(f"{vendor}:{part_number}".encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def _read(path: str) -> Optional[VendorPriceResult]:
+    try:
+        with open(path, "rb") as f:
+            entry = orjson.loads(f.read())
+        if entry["expires_at"] < time.time():
+            return None
+        data = entry["result"]
+        data["price"] = Decimal(data["price"])
+        return VendorPriceResult(**data)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # Unreadable or from an older layout - treat as a miss
+        logger.warning(f"PRICE CACHE: Ignoring bad entry {path}: {e}")
+        return None
+
+
+def _write(path: str, result: VendorPriceResult, ttl: int):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    entry = {"expires_at": time.time() + ttl, "result": dataclasses.asdict(result)}
+    # Write then rename, so a concurrent reader never sees a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(orjson.dumps(entry, default=str))
+    os.replace(tmp_path, path)
+
+
+async def get(vendor: str, part_number: str) -> Optional[VendorPriceResult]:
+    """Return the cached offer for this vendor/part, or None if missing or expired."""
+    return await asyncio.to_thread(_read, _path(vendor, part_number))
+
+
+async def set(vendor: str, part_number: str, result: VendorPriceResult, ttl: int = DEFAULT_TTL_SECONDS):
+    """Cache a live-scraped offer. Failures are logged, never raised."""
+    try:
+        await asyncio.to_thread(_write, _path(vendor, part_number), result, ttl)
+    except Exception as e:
+        logger.warning(f"PRICE CACHE: Could not store {vendor}:{part_number}: {e}")
@@ -9,6 +9,8 @@ The Scraper Service handles all vendor website scraping via Chrome CDP.
 
 import logging
 import httpx
+import orjson
+from app.utils.http_client import get_http_client
 from typing import Optional, List, Dict
 from pydantic import BaseModel
 from app.core.config import settings
@@ -34,10 +36,10 @@ class ScraperClient:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, json=data, headers=headers)
-                response.raise_for_status()
-                return response.json()
+            client = get_http_client()
+            response = await client.post(url, content=orjson.dumps(data), headers=headers, timeout=self.timeout)
+            response.raise_for_status()
+            return orjson.loads(response.content)
         except httpx.ConnectError:
             logger.error(f"Cannot connect to Scraper Service at {url}")
             return {"success": False, "error": "Scraper Service not available"}
@@ -85,9 +87,9 @@ class ScraperClient:
     async def health_check(self) -> dict:
         """Check if Scraper Service is healthy"""
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_url}/health")
-                return response.json()
+            client = get_http_client()
+            response = await client.get(f"{self.base_url}/health", timeout=5.0)
+            return orjson.loads(response.content)
         except Exception as e:
             return {"status": "unreachable", "error": str(e)}
 
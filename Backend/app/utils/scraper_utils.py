@@ -8,11 +8,16 @@ Provides common utilities for web scraping across all adapters:
 - Anti-Detection Measures
 """
 
+import json
 import logging
 import asyncio
+import os
 import random
-from typing import Optional, Tuple, Literal
-from playwright.async_api import async_playwright, Browser, Page, BrowserContext
+import time
+import weakref
+from typing import Dict, Optional, Tuple, Literal
+from playwright.async_api import async_playwright, Browser, Page, BrowserContext, Route
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -61,11 +66,274 @@ async def get_cdp_connection() -> Tuple[Optional[Browser], Optional[BrowserConte
         return None, None, None
 
 
-async def get_stealth_browser() -> Tuple[Optional[Browser], Optional[BrowserContext], Optional[Page]]:
+# Shared CDP session: one connection to the manual Chrome instance, with a
+# bounded pool of tabs recycled between requests.
+CDP_PAGE_POOL_SIZE = 4
+
+_cdp_state: dict = {}
+_cdp_connect_lock = asyncio.Lock()
+_page_pool: asyncio.Queue = asyncio.Queue()
+_page_slots = asyncio.Semaphore(CDP_PAGE_POOL_SIZE)
+
+
+async def _get_cdp_context() -> Optional[BrowserContext]:
+    """Return the shared CDP context, (re)connecting if needed."""
+    browser = _cdp_state.get("browser")
+    if browser and browser.is_connected():
+        return _cdp_state["context"]
+
+    async with _cdp_connect_lock:
+        browser = _cdp_state.get("browser")
+        if browser and browser.is_connected():
+            return _cdp_state["context"]
+
+        # Stop the driver of a dropped connection before starting a new one
+        await close_cdp_session()
+
+        playwright = await async_playwright().start()
+        try:
+            browser = await playwright.chromium.connect_over_cdp(CDP_ENDPOINT)
+        except Exception as e:
+            await playwright.stop()
+            logger.error(f"CDP connection failed: {e}")
+            logger.error("Please run 'start_chrome.bat' and login to vendor sites first!")
+            return None
+
+        context = browser.contexts[0]
+        _cdp_state.update(playwright=playwright, browser=browser, context=context)
+        logger.info("CDP connection established successfully")
+        return context
+
+
+async def acquire_cdp_page() -> Optional[Page]:
+    """
+    Get a tab on the shared CDP session.
+    Reuses an idle pooled tab when available. Every page returned must be
+    handed back with release_cdp_page().
+
+    Returns:
+        Page, or None if Chrome is not reachable
+    """
+    await _page_slots.acquire()
+    try:
+        context = await _get_cdp_context()
+        if not context:
+            _page_slots.release()
+            return None
+
+        while not _page_pool.empty():
+            page = _page_pool.get_nowait()
+            if not page.is_closed():
+                return page
+
+        return await context.new_page()
+    except BaseException:
+        _page_slots.release()
+        raise
+
+
+async def release_cdp_page(page: Page):
+    """
+    Return a tab to the pool (blanked), or close it if it can't be reused.
+    Any resource blocking is removed first: the pool is shared between
+    scrapers, and the next borrower may rely on the page's CSS.
+    """
+    try:
+        if not page.is_closed():
+            if page in _resource_blocked_pages:
+                await page.unroute("**/*", _abort_heavy_resources)
+                _resource_blocked_pages.discard(page)
+            await page.goto("about:blank")
+            _page_pool.put_nowait(page)
+    except Exception as e:
+        logger.debug("Discarding CDP page: %s", e)
+        try:
+            await page.close()
+        except Exception:
+            pass
+    finally:
+        _page_slots.release()
+
+
+async def close_cdp_session():
+    """
+    Close pooled tabs and disconnect from the shared CDP session.
+    The manual Chrome instance itself (and its logins) is left running.
+    """
+    while not _page_pool.empty():
+        page = _page_pool.get_nowait()
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+    playwright = _cdp_state.get("playwright")
+    _cdp_state.clear()
+    if playwright:
+        try:
+            await playwright.stop()
+        except Exception as e:
+            logger.debug("Stopping CDP driver failed: %s", e)
+
+
+# Resource types never needed to read text off a vendor page. Stylesheets
+# stay: ">> visible=true" selectors and offsetParent checks depend on the
+# site's CSS to tell hidden elements from visible ones.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+_resource_blocked_pages: "weakref.WeakSet[Page]" = weakref.WeakSet()
+
+
+async def _abort_heavy_resources(route: Route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def block_heavy_resources(page: Page):
+    """
+    Stop a page from loading images, fonts and media.
+    Routed per page rather than per context, so the user's own tabs in the
+    shared Chrome session keep rendering normally. Safe to call repeatedly;
+    the route is only registered once, and release_cdp_page() removes it
+    before the tab goes back to the pool.
+    """
+    if page in _resource_blocked_pages:
+        return
+    await page.route("**/*", _abort_heavy_resources)
+    _resource_blocked_pages.add(page)
+
+
+_WAIT_FOR_NODE_JS = """
+([selector, timeout]) => new Promise((resolve) => {
+    if (document.querySelector(selector)) return resolve(true);
+    const observer = new MutationObserver(() => {
+        if (document.querySelector(selector)) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(true);
+        }
+    });
+    observer.observe(document, {subtree: true, childList: true, attributes: true});
+    const timer = setTimeout(() => { observer.disconnect(); resolve(false); }, timeout);
+})
+"""
+
+
+async def wait_for_mutation(page: Page, selector: str, timeout: int = 10000) -> bool:
+    """
+    Wait for a CSS selector to appear using an in-page MutationObserver.
+    Resolves as soon as the DOM changes to include it, instead of on
+    Playwright's polling interval. Use plain CSS only - no Playwright
+    selector extensions like ">> visible=true".
+    
+    Returns:
+        True if the element appeared, False on timeout
+    """
+    return await page.evaluate(_WAIT_FOR_NODE_JS, [selector, timeout])
+
+
+_READ_VISIBLE_TEXTS_JS = """
+(fields) => {
+    const texts = {};
+    for (const [name, css] of Object.entries(fields)) {
+        texts[name] = null;
+        for (const el of document.querySelectorAll(css)) {
+            if (el.offsetParent !== null) {
+                texts[name] = (el.innerText || '').trim();
+                break;
+            }
+        }
+    }
+    return texts;
+}
+"""
+
+# Stealth contexts install the reader once as window.__readVisibleTexts, so
+# each call only ships the field map instead of re-parsing the function
+_READ_VISIBLE_TEXTS_INIT_JS = f"window.__readVisibleTexts = {_READ_VISIBLE_TEXTS_JS.strip()};"
+
+
+async def read_visible_texts(page: Page, fields: Dict[str, str]) -> Dict[str, Optional[str]]:
+    """
+    Read the text of the first visible match for each named CSS selector
+    in one page.evaluate, instead of a visibility probe plus inner_text
+    per field. Fields with no visible match come back as None. Plain CSS
+    only, as with wait_for_mutation.
+    """
+    texts = await page.evaluate("(fields) => window.__readVisibleTexts?.(fields) ?? null", fields)
+    if texts is None:
+        # Page not from a stealth context - send the full function
+        texts = await page.evaluate(_READ_VISIBLE_TEXTS_JS, fields)
+    return texts
+
+
+async def get_cdp_cookies(url: str) -> dict:
+    """
+    Read the cookies the shared CDP session holds for a site, so plain HTTP
+    clients can reuse a logged-in browser session.
+
+    Returns:
+        {name: value} dict, empty if Chrome is not reachable
+    """
+    context = await _get_cdp_context()
+    if not context:
+        return {}
+    cookies = await context.cookies(url)
+    return {cookie["name"]: cookie["value"] for cookie in cookies}
+
+
+# Stealth contexts belong to us, so they are filtered at the context level.
+# Stylesheets stay: the vendor scrapers pick price cells by visibility,
+# which the site's CSS decides.
+STEALTH_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+BLOCKED_URL_KEYWORDS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "hotjar",
+    "segment.io",
+)
+
+
+async def _abort_stealth_extras(route: Route):
+    request = route.request
+    if (request.resource_type in STEALTH_BLOCKED_RESOURCE_TYPES
+            or any(keyword in request.url for keyword in BLOCKED_URL_KEYWORDS)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Playwright driver behind each launched stealth browser, stopped with it
+_stealth_drivers: dict = {}
+
+# Long-lived stealth browser per vendor: vendor -> (browser, context, page)
+_stealth_sessions: Dict[str, Tuple[Browser, BrowserContext, Page]] = {}
+_stealth_sessions_lock = asyncio.Lock()
+
+
+# Realistic desktop fingerprint shared by every stealth context
+STEALTH_CONTEXT_OPTIONS = {
+    'viewport': {'width': 1920, 'height': 1080},
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'locale': 'en-US',
+    'timezone_id': 'America/Los_Angeles',
+}
+
+
+async def get_stealth_browser(
+    storage_state: Optional[dict] = None
+) -> Tuple[Optional[Browser], Optional[BrowserContext], Optional[Page]]:
     """
     Launch a new browser instance with stealth settings.
     Used for Worldpac and SSF which have simpler security.
     
+    Args:
+        storage_state: Saved session (see load_auth_state) to start logged in
+    
     Returns:
         Tuple of (browser, context, page) or (None, None, None) if launch fails
     """
@@ -88,14 +356,12 @@ async def get_stealth_browser() -> Tuple[Optional[Browser], Optional[BrowserCont
                 '--ignore-certificate-errors-spki-list',
             ]
         )
+        _stealth_drivers[browser] = p
         
         # Create context with realistic settings
-        context = await browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            locale='en-US',
-            timezone_id='America/Los_Angeles',
-        )
+        context = await browser.new_context(storage_state=storage_state, **STEALTH_CONTEXT_OPTIONS)
+        await context.route("**/*", _abort_stealth_extras)
+        await context.add_init_script(_READ_VISIBLE_TEXTS_INIT_JS)
         
         page = await context.new_page()
         
@@ -113,8 +379,114 @@ async def get_stealth_browser() -> Tuple[Optional[Browser], Optional[BrowserCont
         return None, None, None
 
 
+# Saved vendor logins (cookies + localStorage) for the stealth browsers
+AUTH_STATE_DIR = ".auth"
+AUTH_STATE_TTL_SECONDS = 6 * 60 * 60
+
+
+def load_auth_state(vendor: str) -> Optional[dict]:
+    """
+    Return the vendor's saved storage_state if it is younger than
+    AUTH_STATE_TTL_SECONDS, else None so the caller logs in again.
+    """
+    path = os.path.join(AUTH_STATE_DIR, f"{vendor}.json")
+    try:
+        if time.time() - os.path.getmtime(path) > AUTH_STATE_TTL_SECONDS:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+async def save_auth_state(vendor: str, context: BrowserContext):
+    """Save a logged-in context's session for load_auth_state()"""
+    try:
+        os.makedirs(AUTH_STATE_DIR, exist_ok=True)
+        await context.storage_state(path=os.path.join(AUTH_STATE_DIR, f"{vendor}.json"))
+        logger.info(f"Saved {vendor} session state")
+    except Exception as e:
+        logger.warning(f"Could not save {vendor} session state: {e}")
+
+
+async def new_stealth_page(
+    browser: Browser,
+    storage_state: Optional[dict] = None
+) -> Tuple[BrowserContext, Page]:
+    """
+    Open another isolated context on a browser from get_stealth_browser().
+    Pass a logged-in context's storage_state() so the new one skips login.
+    The caller closes the returned context.
+    """
+    from playwright_stealth import stealth_async
+    
+    context = await browser.new_context(storage_state=storage_state, **STEALTH_CONTEXT_OPTIONS)
+    try:
+        await context.route("**/*", _abort_stealth_extras)
+        await context.add_init_script(_READ_VISIBLE_TEXTS_INIT_JS)
+        page = await context.new_page()
+        await stealth_async(page)
+    except BaseException:
+        # Failed or cancelled before the caller got the context to close
+        await context.close()
+        raise
+    return context, page
+
+
+async def close_stealth_browser(browser: Browser):
+    """Close a browser from get_stealth_browser() and stop its Playwright driver"""
+    try:
+        await browser.close()
+    except Exception:
+        pass
+    
+    playwright = _stealth_drivers.pop(browser, None)
+    if playwright:
+        try:
+            await playwright.stop()
+        except Exception as e:
+            logger.debug("Stopping stealth driver failed: %s", e)
+
+
+async def get_or_create_browser(
+    vendor: str,
+    storage_state: Optional[dict] = None
+) -> Tuple[Optional[Browser], Optional[BrowserContext], Optional[Page]]:
+    """
+    Return the vendor's long-lived stealth browser, launching it on first
+    use or if Chromium has crashed or its page was closed. Callers must not
+    close it; it lives until close_stealth_browsers() at shutdown.
+    storage_state only applies when a new browser is launched.
+    """
+    async with _stealth_sessions_lock:
+        session = _stealth_sessions.get(vendor)
+        if session:
+            browser, context, page = session
+            if browser.is_connected() and not page.is_closed():
+                return session
+            logger.warning(f"Stealth browser for {vendor} is gone, relaunching")
+            del _stealth_sessions[vendor]
+            await close_stealth_browser(browser)
+        
+        browser, context, page = await get_stealth_browser(storage_state)
+        if browser:
+            _stealth_sessions[vendor] = (browser, context, page)
+        return browser, context, page
+
+
+async def close_stealth_browsers():
+    """Close every long-lived vendor browser (app shutdown)"""
+    async with _stealth_sessions_lock:
+        sessions = list(_stealth_sessions.values())
+        _stealth_sessions.clear()
+    for browser, _, _ in sessions:
+        await close_stealth_browser(browser)
+
+
 async def human_delay(min_ms: int = 500, max_ms: int = 2000):
-    """Add human-like random delay between actions"""
+    """Add human-like random delay between actions (no-op unless SCRAPER_STEALTH)"""
+    if not settings.SCRAPER_STEALTH:
+        return
     delay = random.randint(min_ms, max_ms)
     await asyncio.sleep(delay / 1000)
 
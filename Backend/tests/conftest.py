@@ -0,0 +1,7 @@
+"""
+Test setup: Settings requires these at import time; tests never connect.
+"""
+import os
+
+os.environ.setdefault("DATABASE_URL", "mongodb://localhost:27017/estimaro_test")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
@@ -0,0 +1,63 @@
+"""
+Portal token cache: a customer's response must not be hidden by a portal
+load that read the estimate just before the response was written.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.estimate import EstimateStatus
+from app.services import estimate_service as estimate_service_module
+from app.services.estimate_service import EstimateService
+
+
+class FakeRepository:
+    """Token lookups that can be held mid-read to line up the race."""
+
+    def __init__(self):
+        self.status = EstimateStatus.SENT
+        self.read_started = asyncio.Event()
+        self.release_read = asyncio.Event()
+
+    async def get_by_token(self, public_token):
+        snapshot = SimpleNamespace(status=self.status, is_expired=False)
+        self.read_started.set()
+        await self.release_read.wait()
+        return snapshot
+
+    async def set_status_by_token(self, public_token, status):
+        self.status = status
+        return True
+
+
+@pytest.fixture
+def service():
+    estimate_service_module._token_cache.clear()
+    service = EstimateService()
+    service.repository = FakeRepository()
+    service._estimate_to_response = lambda est: SimpleNamespace(status=est.status, expiresAt=None)
+    yield service
+    estimate_service_module._token_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_respond_during_load_is_not_overwritten(service):
+    token = "race-token"
+    repo = service.repository
+
+    # Portal GET reads the old status and is still in flight...
+    load = asyncio.create_task(service.get_estimate_by_token(token))
+    await repo.read_started.wait()
+
+    # ...when the customer approves
+    respond = asyncio.create_task(service.respond_by_token(token, EstimateStatus.APPROVED))
+    await asyncio.sleep(0)
+    repo.release_read.set()
+
+    stale = await load
+    assert stale.status == EstimateStatus.SENT
+    assert await respond
+
+    fresh = await service.get_estimate_by_token(token)
+    assert fresh.status == EstimateStatus.APPROVED